@@ -6,7 +6,7 @@ Contains all environment variables, constants, and configuration settings
 
 import os
 import datetime
-from dotenv import load_dotenv
+from modules.env import load_env_once
 
 # Optional torch import (not needed for Parakeet/ONNX)
 try:
@@ -16,8 +16,8 @@ except ImportError:
     torch = None
     TORCH_AVAILABLE = False
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (once per process)
+load_env_once()
 
 # ===============================
 # WEB SCRAPING CONFIGURATION
@@ -34,6 +34,8 @@ CAPTIONS_DIR = "captions"
 LAST_CLEANUP_FILE = "last_cleanup.txt"
 PROXY_LIST_FILE = "proxy_list.txt" # Still used by ProxyManager for internal tracking
 LAST_PROXY_UPDATE_FILE = "last_proxy_update.txt" # Still used by ProxyManager for internal tracking
+URL_CACHE_FILE = "url_cache.db" # SQLite cache of downloaded video/audio per meeting URL
+TRANSCRIPT_CACHE_DIR = "transcript_cache" # Transcripts cached by audio content hash
 
 # ===============================
 # EMAIL CONFIGURATION
@@ -65,6 +67,16 @@ GRANITE_WORKERS = int(os.getenv("GRANITE_WORKERS", "2"))
 GRANITE_CHUNK_DURATION = int(os.getenv("GRANITE_CHUNK_DURATION", "1200"))  # 20 min in seconds
 GRANITE_DEVICE = os.getenv("GRANITE_DEVICE", "auto")  # auto, cuda, cpu
 
+# Persistent model server (python -m modules.model_server) keeping models loaded between runs
+# Socket and generated auth key live in a private (0700) per-user directory
+MODEL_SERVER_DIR = os.getenv(
+    "MODEL_SERVER_DIR",
+    os.path.join(os.getenv("XDG_RUNTIME_DIR") or os.path.expanduser("~/.cache"), "roadrunner")
+)
+MODEL_SERVER_SOCKET = os.path.join(MODEL_SERVER_DIR, "models.sock")
+MODEL_SERVER_AUTHKEY = os.getenv("MODEL_SERVER_AUTHKEY")  # None: use the key file the server generates
+MODEL_SERVER_IDLE_MINUTES = int(os.getenv("MODEL_SERVER_IDLE_MINUTES", "15"))  # Unload models idle this long
+
 # ===============================
 # WHISPER CONFIGURATION (Fallback)
 # ===============================
@@ -79,6 +91,13 @@ WHISPERX_COMPUTE_TYPE = "float32"
 WHISPERX_BATCH_SIZE = 32
 HF_TOKEN = os.getenv("HF_TOKEN")  # Hugging Face token for models
 
+# ===============================
+# VIDEO DOWNLOAD CONFIGURATION
+# ===============================
+YTDLP_CONCURRENT_FRAGMENTS = int(os.getenv("YTDLP_CONCURRENT_FRAGMENTS", "8"))  # Parallel HLS fragment fetches
+YTDLP_USE_ARIA2C = os.getenv("YTDLP_USE_ARIA2C", "false").lower() == "true"  # Opt-in, only used if aria2c is installed
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv("MAX_CONCURRENT_DOWNLOADS", "3"))  # New entries downloaded side by side per hourly run
+
 # ===============================
 # OXYLABS ISP PROXY CONFIGURATION
 # ===============================
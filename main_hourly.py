@@ -6,6 +6,7 @@ Uses Granite Speech pipeline for high-accuracy transcription and uploads to Seaf
 Optimized for AMD hardware with ROCm support
 """
 
+import asyncio
 import logging
 import datetime
 import time
@@ -19,7 +20,7 @@ load_dotenv()
 
 from config import *
 from modules.web_scraper import get_current_entries
-from modules.video_processor import download_video, extract_audio_from_video
+from modules.video_processor import download_video, download_videos_async, extract_audio_from_video
 from modules.transcript_pipeline import TranscriptPipeline
 from modules.seafile_client import SeafileClient
 from modules.sftp_client import SFTPClient
@@ -124,8 +125,13 @@ def handle_processing_failure(entry_link, reason, committee_name, meeting_date_s
         return False, False
 
 
-def process_entry(entry, proxy_manager, seafile_client):
-    """Process entry using Canary pipeline and upload to Seafile."""
+def process_entry(entry, proxy_manager, seafile_client, video_path=None):
+    """
+    Process entry using Canary pipeline and upload to Seafile.
+
+    video_path is the entry's already-downloaded video (see
+    download_videos_async); when None the video is downloaded here.
+    """
     processing_start_time = time.time()
     
     # Extract meeting info early for notifications
@@ -150,9 +156,10 @@ def process_entry(entry, proxy_manager, seafile_client):
         
         logger.info(f"Processing: {entry['text'][:80]}")
         
-        # Download video with proxy
+        # Download video with proxy (unless it was fetched with the batch)
         logger.info("Step 1/4: Downloading video...")
-        video_path = download_video(entry_link, proxy_manager=proxy_manager)
+        if video_path is None:
+            video_path = download_video(entry_link, proxy_manager=proxy_manager)
         if not video_path:
             logger.error("Failed to download video")
             should_mark, is_max = handle_processing_failure(
@@ -484,13 +491,23 @@ def run_hourly_check():
     logger.info(f"📋 Found {len(filtered_entries)} new entry/entries to process")
     logger.info("="*70)
     
+    # Download all new entries' videos concurrently; a failed download comes
+    # back as None, and process_entry retries it once before its usual
+    # failure handling
+    entry_links = [e['link'] for e in filtered_entries if e.get('link')]
+    logger.info(f"📥 Downloading {len(entry_links)} video(s), up to {MAX_CONCURRENT_DOWNLOADS} at a time...")
+    video_paths = dict(zip(entry_links, asyncio.run(
+        download_videos_async(entry_links, proxy_manager=proxy_manager, max_concurrent=MAX_CONCURRENT_DOWNLOADS)
+    )))
+    
     # Process each entry
     processed_count = 0
     failed_count = 0
     
     for i, entry in enumerate(filtered_entries, 1):
         logger.info(f"\n📝 Processing entry {i}/{len(filtered_entries)}")
-        result = process_entry(entry, proxy_manager, seafile_client)
+        result = process_entry(entry, proxy_manager, seafile_client,
+                               video_path=video_paths.get(entry.get('link')))
         
         if result:
             processed_count += 1
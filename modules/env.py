@@ -0,0 +1,24 @@
+# modules/env.py
+
+import os
+
+from dotenv import load_dotenv
+
+# Set once the .env file has been applied. Child processes inherit it along
+# with the variables themselves, so they skip re-reading the file too.
+ENV_LOADED_FLAG = 'ROADRUNNER_ENV_LOADED'
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_env_once():
+    """
+    Load the project's .env file the first time it is asked for.
+
+    Values already in the environment (e.g. set by a test harness or the
+    shell) are never overridden.
+    """
+    if os.environ.get(ENV_LOADED_FLAG):
+        return
+    load_dotenv(os.path.join(_PROJECT_DIR, '.env'), override=False)
+    os.environ[ENV_LOADED_FLAG] = '1'
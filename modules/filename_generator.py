@@ -6,7 +6,7 @@ Handles naming conventions for interim vs session committees.
 import logging
 import re
 from datetime import datetime
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +176,17 @@ class FilenameGenerator:
         "zlicw": "ZLICW",
     }
     
+    # Acronyms accepted when spelled out in the title, for O(1) membership tests
+    KNOWN_ACRONYMS = frozenset(COMMITTEE_ACRONYMS.values())
+    
+    # Patterns compiled once for every title
+    ACRONYM_PATTERN = re.compile(r'\b([A-Z]{2,5})\b')
+    # Time range in a title (e.g., "8:37 AM - 11:53 AM")
+    TIME_RANGE_PATTERN = re.compile(
+        r'(\d{1,2})[:\s]?(\d{2})\s*(AM|PM)\s*-\s*(\d{1,2})[:\s]?(\d{2})\s*(AM|PM)',
+        re.IGNORECASE
+    )
+    
     def __init__(self):
         """Initialize filename generator."""
         pass
@@ -226,11 +237,11 @@ class FilenameGenerator:
                 return acronym
         
         # Try to extract acronym if present (e.g., "IC - LFC" or "HAFC -")
-        acronym_match = re.search(r'\b([A-Z]{2,5})\b', title)
+        acronym_match = self.ACRONYM_PATTERN.search(title)
         if acronym_match:
             potential_acronym = acronym_match.group(1)
             # Verify it's a known acronym
-            if potential_acronym in self.COMMITTEE_ACRONYMS.values():
+            if potential_acronym in self.KNOWN_ACRONYMS:
                 return potential_acronym
         
         # Fallback: try to create acronym from title
@@ -256,8 +267,7 @@ class FilenameGenerator:
             Tuple of (start_time, end_time) in format like '837AM', '1153AM'
         """
         # Try to find time range in title (e.g., "8:37 AM - 11:53 AM")
-        time_pattern = r'(\d{1,2})[:\s]?(\d{2})\s*(AM|PM)\s*-\s*(\d{1,2})[:\s]?(\d{2})\s*(AM|PM)'
-        match = re.search(time_pattern, title, re.IGNORECASE)
+        match = self.TIME_RANGE_PATTERN.search(title)
         
         if match:
             start_hour, start_min, start_ampm = match.group(1), match.group(2), match.group(3).upper()
@@ -315,6 +325,20 @@ class FilenameGenerator:
             'end_time': end_time
         }
     
+    def generate_filenames_batch(self, titles: List[str], meeting_dates: List[datetime]) -> List[Dict[str, str]]:
+        """
+        Generate filename info for several meetings in one call.
+        
+        Args:
+            titles: Meeting titles
+            meeting_dates: Meeting datetimes, one per title
+            
+        Returns:
+            List of dicts from generate_filename(), in input order
+        """
+        generate = self.generate_filename
+        return [generate(title, meeting_date) for title, meeting_date in zip(titles, meeting_dates)]
+    
     def get_seafile_path(self, filename_info: Dict[str, str]) -> str:
         """
         Generate Seafile upload path based on session type.
@@ -0,0 +1,48 @@
+# modules/formatting.py
+"""
+Small helpers shared by the standalone pipeline scripts
+(run_aligned_pipeline*.py, run_full_pipeline.py, run_pipeline_batch.py).
+"""
+
+import json
+
+import numpy as np
+
+# Optional orjson import (faster JSON output, falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def format_mmss(times):
+    """Format second offsets as MM:SS strings with one vectorized divmod."""
+    whole = np.floor(np.asarray(times, dtype=np.float64)).astype(np.int64)
+    minutes, seconds = np.divmod(whole, 60)
+    return [f"{m:02d}:{s:02d}" for m, s in zip(minutes.tolist(), seconds.tolist())]
+
+
+def speaker_run_starts(ids):
+    """Return the index where each run of equal speaker ids begins."""
+    ids = np.asarray(ids)
+    if not len(ids):
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(([0], np.flatnonzero(ids[1:] != ids[:-1]) + 1))
+
+
+def speaker_runs(speakers):
+    """Split a speaker label sequence into (start, end) index runs."""
+    if not speakers:
+        return []
+    starts = speaker_run_starts(speakers).tolist()
+    return list(zip(starts, starts[1:] + [len(speakers)]))
+
+
+def write_json(path, data):
+    """Write data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
@@ -9,9 +9,9 @@ import tempfile
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
+from modules.env import load_env_once
 # Ensure .env is loaded for HF_TOKEN
-load_dotenv()
+load_env_once()
 
 import torch
 import torchaudio
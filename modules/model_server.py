@@ -0,0 +1,290 @@
+"""
+Persistent model server.
+
+Keeps the ASR models loaded in one long-running process so scripts that are
+run repeatedly (pipelines, tests, scheduled jobs) skip the 10-30 s model load.
+Start it once with:
+
+    python -m modules.model_server
+
+Scripts call connect() and fall back to loading the model themselves when no
+server is running. The socket and the server's generated auth key live in
+MODEL_SERVER_DIR, which must be private to the user (mode 0700); set
+MODEL_SERVER_AUTHKEY to use a fixed key instead. Models left idle for MODEL_SERVER_IDLE_MINUTES are
+unloaded to free RAM/VRAM and reloaded on the next request.
+"""
+
+import gc
+import logging
+import os
+import secrets
+import stat
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.managers import BaseManager
+
+from config import (
+    MODEL_SERVER_DIR, MODEL_SERVER_SOCKET, MODEL_SERVER_AUTHKEY, MODEL_SERVER_IDLE_MINUTES,
+    PARAKEET_MODEL, PARAKEET_CHUNK_DURATION
+)
+
+logger = logging.getLogger(__name__)
+
+# Key generated by the server when MODEL_SERVER_AUTHKEY is not set
+AUTHKEY_FILE = os.path.join(MODEL_SERVER_DIR, "authkey")
+
+# Loaded models by key, with their last-use time and in-flight request count
+_MODELS = {}
+_LAST_USED = {}
+_ACTIVE = {}
+_LOCK = threading.Lock()
+# Per-model locks held while loading, so a slow load does not block requests for other models
+_LOAD_LOCKS = {}
+
+
+def _parakeet_settings(device=None, quantization=None, chunk_duration=None):
+    """
+    Resolve the Parakeet settings for a request.
+
+    Without an explicit device: CUDA when available, otherwise INT8 weights
+    on CPU. An explicit device is used as given, with the given quantization.
+    """
+    if device is None:
+        import onnxruntime as ort
+
+        if "CUDAExecutionProvider" in ort.get_available_providers():
+            device = "cuda"
+        else:
+            device, quantization = "cpu", quantization or "int8"
+    return device, quantization, chunk_duration or PARAKEET_CHUNK_DURATION
+
+
+def _load_parakeet(device, quantization, chunk_duration):
+    from modules.parakeet_transcription import ParakeetTranscriber
+
+    transcriber = ParakeetTranscriber(
+        PARAKEET_MODEL, device=device, chunk_duration=chunk_duration, quantization=quantization
+    )
+    transcriber.load_model()
+    return transcriber
+
+
+def _load_canary():
+    """Canary-1b-v2 via NeMo, on GPU when available."""
+    import torch
+    import nemo.collections.asr as nemo_asr
+
+    model = nemo_asr.models.EncDecMultiTaskModel.from_pretrained("nvidia/canary-1b-v2")
+    model = model.to("cuda" if torch.cuda.is_available() else "cpu")
+    model.eval()
+    if torch.cuda.is_available():
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+    return model
+
+
+def _canary_autocast():
+    """BF16 (Ampere+) or FP16 autocast on GPU, a no-op context on CPU."""
+    import torch
+
+    if not torch.cuda.is_available():
+        return torch.autocast("cpu", enabled=False)
+    dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return torch.autocast("cuda", dtype=dtype)
+
+
+def _acquire(name, loader, *args):
+    """Return the named model, loading it with loader(*args) on first use, and mark it in use."""
+    with _LOCK:
+        # Counted as in use from here on, so the evictor leaves it alone
+        _ACTIVE[name] = _ACTIVE.get(name, 0) + 1
+        model = _MODELS.get(name)
+        load_lock = _LOAD_LOCKS.setdefault(name, threading.Lock())
+    if model is not None:
+        return model
+
+    try:
+        with load_lock:
+            with _LOCK:
+                model = _MODELS.get(name)
+            if model is None:
+                logger.info(f"Loading {name} model...")
+                start = time.time()
+                model = loader(*args)
+                logger.info(f"{name} model loaded in {time.time() - start:.1f}s")
+                with _LOCK:
+                    _MODELS[name] = model
+    except Exception:
+        _release(name)
+        raise
+    return model
+
+
+def _release(name):
+    with _LOCK:
+        _ACTIVE[name] -= 1
+        _LAST_USED[name] = time.monotonic()
+
+
+def _empty_cuda_cache():
+    """Hand cached VRAM back to the driver if torch has been loaded."""
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _evict_idle_models(idle_seconds):
+    """Background loop unloading models that have not been used recently."""
+    while True:
+        time.sleep(min(60, idle_seconds))
+        now = time.monotonic()
+        with _LOCK:
+            idle = [
+                name for name in _MODELS
+                if not _ACTIVE.get(name) and now - _LAST_USED.get(name, now) > idle_seconds
+            ]
+            for name in idle:
+                del _MODELS[name]
+                logger.info(f"Unloaded {name} model after {idle_seconds / 60:.0f} idle minutes")
+        if idle:
+            gc.collect()
+            _empty_cuda_cache()
+
+
+class ModelService:
+    """Transcription calls served from the models held by this process."""
+
+    def transcribe_parakeet(self, audio_path, device=None, quantization=None, chunk_duration=None):
+        """
+        Transcribe one audio file (path as seen by the server) with Parakeet.
+
+        Each distinct (device, quantization, chunk_duration) gets its own
+        loaded model; leave device unset for the server's default (CUDA, or
+        INT8 on CPU).
+        """
+        settings = _parakeet_settings(device, quantization, chunk_duration)
+        name = f"parakeet ({settings[0]}, {settings[1] or 'fp32'}, {settings[2]}s chunks)"
+        transcriber = _acquire(name, _load_parakeet, *settings)
+        try:
+            return transcriber.transcribe(audio_path)
+        finally:
+            _release(name)
+
+    def transcribe_canary(self, audio_paths, batch_size=1):
+        """Transcribe audio files with Canary, returning one text per file."""
+        import torch
+
+        model = _acquire('canary', _load_canary)
+        try:
+            with torch.inference_mode(), _canary_autocast():
+                hypotheses = model.transcribe(list(audio_paths), batch_size=batch_size)
+            return [getattr(h, 'text', h) for h in hypotheses]
+        finally:
+            _release('canary')
+
+
+class ModelManager(BaseManager):
+    pass
+
+
+_service = ModelService()
+ModelManager.register('models', callable=lambda: _service)
+
+
+def _check_private(path):
+    """Refuse paths owned by another user or accessible to group/other."""
+    st = os.stat(path)
+    if st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+        raise PermissionError(f"{path} must be owned by this user and not group/world accessible")
+
+
+def _read_authkey():
+    """The configured auth key, or the server's key file; None when neither exists."""
+    if MODEL_SERVER_AUTHKEY:
+        return MODEL_SERVER_AUTHKEY.encode()
+    if not os.path.exists(AUTHKEY_FILE):
+        return None
+    _check_private(MODEL_SERVER_DIR)
+    _check_private(AUTHKEY_FILE)
+    with open(AUTHKEY_FILE, 'rb') as f:
+        return f.read().strip()
+
+
+def _create_authkey():
+    """Generate a fresh random key into a 0600 file (unless one is configured)."""
+    if MODEL_SERVER_AUTHKEY:
+        return MODEL_SERVER_AUTHKEY.encode()
+    key = secrets.token_hex(32).encode()
+    if os.path.exists(AUTHKEY_FILE):
+        os.unlink(AUTHKEY_FILE)
+    fd = os.open(AUTHKEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+def _make_manager(authkey):
+    return ModelManager(address=MODEL_SERVER_SOCKET, authkey=authkey)
+
+
+def connect():
+    """
+    Connect to a running model server.
+
+    Returns:
+        ModelService proxy, or None when no server is listening (callers then
+        load the model locally).
+    """
+    if not os.path.exists(MODEL_SERVER_SOCKET):
+        return None
+
+    try:
+        authkey = _read_authkey()
+        if authkey is None:
+            logger.warning("No model server auth key (set MODEL_SERVER_AUTHKEY or start the server)")
+            return None
+        manager = _make_manager(authkey)
+        manager.connect()
+        return manager.models()
+    except (OSError, EOFError, AuthenticationError) as e:
+        logger.warning(f"Model server not reachable at {MODEL_SERVER_SOCKET}: {e}")
+        return None
+
+
+def serve():
+    """Run the model server until interrupted."""
+    os.makedirs(MODEL_SERVER_DIR, mode=0o700, exist_ok=True)
+    try:
+        _check_private(MODEL_SERVER_DIR)
+    except PermissionError as e:
+        logger.error(f"Refusing to start model server: {e}")
+        return
+
+    if os.path.exists(MODEL_SERVER_SOCKET):
+        if connect() is not None:
+            logger.error(f"Model server already running on {MODEL_SERVER_SOCKET}")
+            return
+        # Left behind by a server that did not shut down cleanly
+        os.unlink(MODEL_SERVER_SOCKET)
+
+    threading.Thread(
+        target=_evict_idle_models, args=(MODEL_SERVER_IDLE_MINUTES * 60,), daemon=True
+    ).start()
+
+    server = _make_manager(_create_authkey()).get_server()
+    os.chmod(MODEL_SERVER_SOCKET, 0o600)
+    logger.info(f"Model server listening on {MODEL_SERVER_SOCKET}")
+    try:
+        server.serve_forever()
+    finally:
+        if os.path.exists(MODEL_SERVER_SOCKET):
+            os.unlink(MODEL_SERVER_SOCKET)
+
+
+if __name__ == "__main__":
+    from config import LOG_FORMAT
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    serve()
@@ -17,6 +17,27 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive session for the sync webhook, created on first use so repeated
+# webhooks from one process reuse the TLS connection to n8n
+_SESSION = None
+
+# Connections kept open to n8n
+WEBHOOK_POOL_SIZE = 4
+
+
+def _get_session():
+    """Return the shared requests.Session for webhook POSTs."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=WEBHOOK_POOL_SIZE, pool_maxsize=WEBHOOK_POOL_SIZE)
+        _SESSION.mount('http://', adapter)
+        _SESSION.mount('https://', adapter)
+    return _SESSION
+
 
 def create_manifest(
     committee: str,
@@ -229,7 +250,7 @@ def send_webhook(
     logger.debug(f"Webhook payload: committee={committee}, date={date}, manifest_path={manifest_path}")
 
     try:
-        response = requests.post(
+        response = _get_session().post(
             webhook_url,
             json=payload,
             timeout=timeout,
@@ -249,3 +270,4 @@ def send_webhook(
     except Exception as e:
         logger.error(f"Webhook error: {e}")
         return False
+
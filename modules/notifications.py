@@ -2,6 +2,7 @@
 Email notification functions
 """
 
+import re
 import smtplib
 import datetime
 import logging
@@ -12,86 +13,8 @@ from config import EMAIL_USER, EMAIL_PASSWORD, EMAIL_RECIPIENTS
 
 logger = logging.getLogger(__name__)
 
-
-def format_meeting_date_for_email(meeting_date):
-    """Format meeting date for email display (e.g., Tuesday, July 1, 2025)."""
-    try:
-        if not meeting_date or len(meeting_date) != 6:
-            return datetime.datetime.now().strftime('%A, %B %d, %Y')
-        
-        # Parse MMDDYY format
-        mm = int(meeting_date[:2])
-        dd = int(meeting_date[2:4])
-        yy = int(meeting_date[4:6])
-        
-        # Assume 20xx for years
-        yyyy = 2000 + yy if yy < 50 else 1900 + yy
-        
-        # Create date object and format
-        date_obj = datetime.datetime(yyyy, mm, dd)
-        return date_obj.strftime('%A, %B %d, %Y')
-        
-    except Exception as e:
-        logger.warning(f"Error formatting meeting date: {e}")
-        return datetime.datetime.now().strftime('%A, %B %d, %Y')
-
-
-def format_meeting_date_for_subject(meeting_date):
-    """Format meeting date for email subject (e.g., 7/1/25)."""
-    try:
-        if not meeting_date or len(meeting_date) != 6:
-            now = datetime.datetime.now()
-            return f"{now.month}/{now.day}/{now.year % 100}"
-        
-        # Parse MMDDYY format
-        mm = int(meeting_date[:2])
-        dd = int(meeting_date[2:4])
-        yy = int(meeting_date[4:6])
-        
-        return f"{mm}/{dd}/{yy}"
-        
-    except Exception as e:
-        logger.warning(f"Error formatting meeting date for subject: {e}")
-        now = datetime.datetime.now()
-        return f"{now.month}/{now.day}/{now.year % 100}"
-
-
-def send_notification(new_entries, transcript_results=None):
-    """Send HTML email notification about new entries with Nextcloud links."""
-    if not all([EMAIL_USER, EMAIL_PASSWORD]):
-        logger.warning("Email configuration missing. Skipping notification.")
-        return
-    
-    try:
-        for recipient in EMAIL_RECIPIENTS:
-            for i, entry in enumerate(new_entries):
-                # Get transcript result for this entry
-                result = transcript_results[i] if transcript_results and i < len(transcript_results) else None
-                
-                if not result:
-                    logger.warning(f"No transcript result for entry {i}, skipping email")
-                    continue
-                
-                # Extract meeting information
-                meeting_info = result.get('meeting_info', {})
-                committee_name = meeting_info.get('committee_name', 'Unknown Committee')
-                
-                # Get meeting date and time from result
-                meeting_date = result.get('meeting_date')
-                meeting_time = result.get('meeting_time', 'Time not available')
-                
-                # Format dates for email
-                formatted_date = format_meeting_date_for_email(meeting_date)
-                subject_date = format_meeting_date_for_subject(meeting_date)
-                
-                # Create email
-                msg = MIMEMultipart('alternative')
-                msg['From'] = EMAIL_USER
-                msg['To'] = recipient
-                msg['Subject'] = f"New Legislature Transcript - {committee_name} - {subject_date}"
-                
-                # HTML email template
-                html_template = '''<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
+# HTML email template; {NAME} placeholders are filled by render_email_html
+HTML_TEMPLATE = '''<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
 <html xmlns="http://www.w3.org/1999/xhtml" xmlns:v="urn:schemas-microsoft-com:vml" xmlns:o="urn:schemas-microsoft-com:office:office" lang="en">
 <head>
 <title></title>
@@ -258,6 +181,92 @@ text-decoration: none
 </td></tr></table>
 </td></tr><tr><td><div class="t60" style="mso-line-height-rule:exactly;mso-line-height-alt:80px;line-height:80px;font-size:1px;display:block;">&nbsp;&nbsp;</div></td></tr></table></td></tr></table></div><div class="gmail-fix" style="display: none; white-space: nowrap; font: 15px courier; line-height: 0;">&nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp; &nbsp;</div></body>
 </html>'''
+
+# Template placeholders; the CSS braces never match (lowercase, whitespace)
+_PLACEHOLDER_RE = re.compile(r'\{([A-Z_]+)\}')
+
+
+def render_email_html(values):
+    """Fill HTML_TEMPLATE's placeholders in one pass, leaving unknown ones as-is."""
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), HTML_TEMPLATE)
+
+
+def format_meeting_date_for_email(meeting_date):
+    """Format meeting date for email display (e.g., Tuesday, July 1, 2025)."""
+    try:
+        if not meeting_date or len(meeting_date) != 6:
+            return datetime.datetime.now().strftime('%A, %B %d, %Y')
+        
+        # Parse MMDDYY format
+        mm = int(meeting_date[:2])
+        dd = int(meeting_date[2:4])
+        yy = int(meeting_date[4:6])
+        
+        # Assume 20xx for years
+        yyyy = 2000 + yy if yy < 50 else 1900 + yy
+        
+        # Create date object and format
+        date_obj = datetime.datetime(yyyy, mm, dd)
+        return date_obj.strftime('%A, %B %d, %Y')
+        
+    except Exception as e:
+        logger.warning(f"Error formatting meeting date: {e}")
+        return datetime.datetime.now().strftime('%A, %B %d, %Y')
+
+
+def format_meeting_date_for_subject(meeting_date):
+    """Format meeting date for email subject (e.g., 7/1/25)."""
+    try:
+        if not meeting_date or len(meeting_date) != 6:
+            now = datetime.datetime.now()
+            return f"{now.month}/{now.day}/{now.year % 100}"
+        
+        # Parse MMDDYY format
+        mm = int(meeting_date[:2])
+        dd = int(meeting_date[2:4])
+        yy = int(meeting_date[4:6])
+        
+        return f"{mm}/{dd}/{yy}"
+        
+    except Exception as e:
+        logger.warning(f"Error formatting meeting date for subject: {e}")
+        now = datetime.datetime.now()
+        return f"{now.month}/{now.day}/{now.year % 100}"
+
+
+def send_notification(new_entries, transcript_results=None):
+    """Send HTML email notification about new entries with Nextcloud links."""
+    if not all([EMAIL_USER, EMAIL_PASSWORD]):
+        logger.warning("Email configuration missing. Skipping notification.")
+        return
+    
+    try:
+        for recipient in EMAIL_RECIPIENTS:
+            for i, entry in enumerate(new_entries):
+                # Get transcript result for this entry
+                result = transcript_results[i] if transcript_results and i < len(transcript_results) else None
+                
+                if not result:
+                    logger.warning(f"No transcript result for entry {i}, skipping email")
+                    continue
+                
+                # Extract meeting information
+                meeting_info = result.get('meeting_info', {})
+                committee_name = meeting_info.get('committee_name', 'Unknown Committee')
+                
+                # Get meeting date and time from result
+                meeting_date = result.get('meeting_date')
+                meeting_time = result.get('meeting_time', 'Time not available')
+                
+                # Format dates for email
+                formatted_date = format_meeting_date_for_email(meeting_date)
+                subject_date = format_meeting_date_for_subject(meeting_date)
+                
+                # Create email
+                msg = MIMEMultipart('alternative')
+                msg['From'] = EMAIL_USER
+                msg['To'] = recipient
+                msg['Subject'] = f"New Legislature Transcript - {committee_name} - {subject_date}"
                 
                 # Replace placeholders with actual data
                 processing_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S MST')
@@ -267,15 +276,17 @@ text-decoration: none
                 if result.get('share_link'):
                     status += " & Available"
                 
-                html_content = html_template.replace('{COMMITTEE_NAME}', committee_name)
-                html_content = html_content.replace('{MEETING_DATE}', formatted_date)
-                html_content = html_content.replace('{MEETING_TIME}', meeting_time)
-                html_content = html_content.replace('{STATUS}', status)
-                html_content = html_content.replace('{VIDEO_SOURCE_URL}', entry.get('link', '#'))
-                html_content = html_content.replace('{PROCESSING_TIME}', processing_time)
                 # Handle None value for share_link (e.g., when rate limited)
                 share_link = result.get('share_link') or '#'
-                html_content = html_content.replace('{NEXTCLOUD_LINK}', share_link)
+                html_content = render_email_html({
+                    'COMMITTEE_NAME': committee_name,
+                    'MEETING_DATE': formatted_date,
+                    'MEETING_TIME': meeting_time,
+                    'STATUS': status,
+                    'VIDEO_SOURCE_URL': entry.get('link', '#'),
+                    'PROCESSING_TIME': processing_time,
+                    'NEXTCLOUD_LINK': share_link
+                })
                 
                 # Create HTML part
                 html_part = MIMEText(html_content, 'html')
@@ -40,7 +40,8 @@ class ParakeetTranscriber:
         self,
         model_name: str = "nemo-parakeet-tdt-0.6b-v2",
         device: str = "cpu",
-        chunk_duration: int = 60
+        chunk_duration: int = 60,
+        quantization: Optional[str] = None
     ):
         """
         Initialize Parakeet transcriber.
@@ -49,6 +50,8 @@ class ParakeetTranscriber:
             model_name: ONNX ASR model name (default: nemo-parakeet-tdt-0.6b-v2)
             device: Device to use ('cpu', 'migraphx'). Default CPU is very fast.
             chunk_duration: Duration of audio chunks in seconds (default: 60)
+            quantization: Optional quantized weights to load (e.g. 'int8',
+                several times faster on CPU). Default loads FP32.
         """
         if not ONNX_ASR_AVAILABLE:
             raise ImportError(
@@ -63,6 +66,7 @@ class ParakeetTranscriber:
         self.model_name = model_name
         self.device = device
         self.chunk_duration = chunk_duration
+        self.quantization = quantization
         self.model = None
         self.sample_rate = 16000  # Parakeet expects 16kHz audio
 
@@ -85,9 +89,12 @@ class ParakeetTranscriber:
             providers = self._get_providers()
             logger.info(f"Loading Parakeet model: {self.model_name}")
             logger.info(f"Execution providers: {providers}")
+            if self.quantization:
+                logger.info(f"Quantization: {self.quantization}")
 
             self.model = onnx_asr.load_model(
                 self.model_name,
+                quantization=self.quantization,
                 providers=providers
             )
 
@@ -106,13 +113,21 @@ class ParakeetTranscriber:
             audio_path: Path to audio file
 
         Returns:
-            Tuple of (audio_data, sample_rate)
+            Tuple of (audio_data, sample_rate). 16-bit mono 16kHz files come
+            back as int16 and are converted to float32 per chunk.
         """
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        # Load audio with soundfile
-        data, sr = sf.read(audio_path)
+        # Already in the model's format: keep the samples as int16 (2 bytes per
+        # sample instead of 4) until each chunk is handed to the model
+        info = sf.info(audio_path)
+        if info.subtype == 'PCM_16' and info.channels == 1 and info.samplerate == self.sample_rate:
+            return sf.read(audio_path, dtype='int16')
+
+        # Otherwise load as float32 (the model's input type) rather than the
+        # float64 default, halving memory for long meetings
+        data, sr = sf.read(audio_path, dtype='float32')
 
         # Convert to mono if stereo
         if len(data.shape) > 1:
@@ -132,6 +147,15 @@ class ParakeetTranscriber:
 
         return data, sr
 
+    @staticmethod
+    def _to_model_input(samples: np.ndarray) -> np.ndarray:
+        """Return samples as float32 in [-1, 1), scaling int16 like libsndfile does."""
+        if samples.dtype == np.int16:
+            out = samples.astype(np.float32)
+            out *= 1.0 / 32768.0
+            return out
+        return samples.astype(np.float32, copy=False)
+
     def _chunk_audio(self, audio_data: np.ndarray, sample_rate: int) -> List[np.ndarray]:
         """
         Split audio into chunks for processing.
@@ -183,31 +207,19 @@ class ParakeetTranscriber:
 
                 transcripts = []
                 for i, chunk in enumerate(chunks):
-                    # Write chunk to temp file
-                    chunk_path = f"/tmp/parakeet_chunk_{i}.wav"
-                    sf.write(chunk_path, chunk, sr)
-
-                    # Transcribe chunk
-                    try:
-                        result = self.model.recognize(chunk_path)
-                        transcripts.append(result)
-                        logger.debug(f"Chunk {i+1}/{len(chunks)}: {len(result)} chars")
-                    finally:
-                        # Cleanup chunk file
-                        if os.path.exists(chunk_path):
-                            os.remove(chunk_path)
+                    # Hand the samples to the model directly, no temp WAV
+                    result = self.model.recognize(
+                        self._to_model_input(chunk), sample_rate=sr
+                    )
+                    transcripts.append(result)
+                    logger.debug(f"Chunk {i+1}/{len(chunks)}: {len(result)} chars")
 
                 transcript = " ".join(transcripts)
             else:
-                # Short audio - transcribe directly
-                # Need to convert to WAV if not already
-                if not audio_path.lower().endswith('.wav'):
-                    temp_wav = "/tmp/parakeet_input.wav"
-                    sf.write(temp_wav, audio_data, sr)
-                    transcript = self.model.recognize(temp_wav)
-                    os.remove(temp_wav)
-                else:
-                    transcript = self.model.recognize(audio_path)
+                # Short audio - transcribe the already decoded samples directly
+                transcript = self.model.recognize(
+                    self._to_model_input(audio_data), sample_rate=sr
+                )
 
             logger.info(f"Transcription complete: {len(transcript)} characters")
             return transcript.strip()
@@ -13,10 +13,11 @@ import logging
 import requests
 from datetime import datetime, timedelta
 from pathlib import Path
-from dotenv import load_dotenv
+
+from modules.env import load_env_once
 
 # Load environment variables
-load_dotenv()
+load_env_once()
 
 logger = logging.getLogger(__name__)
 
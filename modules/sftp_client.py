@@ -5,13 +5,22 @@ Uses paramiko for secure file transfer.
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import paramiko
 from stat import S_ISDIR
 
 logger = logging.getLogger(__name__)
 
+# Parallel uploads: SFTP channels opened on the one SSH transport, and the
+# write size (kept under paramiko's 32 KiB packet limit so each write is a
+# single pipelined request instead of stalling on the channel lock)
+PARALLEL_CHANNELS = 3
+WRITE_CHUNK_SIZE = 32000
+# Local reads are much larger than the SFTP writes they are sliced into
+LOCAL_READ_SIZE = 1 << 20  # 1 MiB
+
 
 class SFTPClient:
     """Client for uploading files to SFTP server."""
@@ -164,7 +173,10 @@ class SFTPClient:
         Returns:
             True if upload successful, False otherwise
         """
-        if not os.path.exists(local_path):
+        # One stat both checks the file exists and gives its size
+        try:
+            file_size = os.stat(local_path).st_size
+        except FileNotFoundError:
             logger.error(f"Local file not found: {local_path}")
             return False
 
@@ -184,8 +196,6 @@ class SFTPClient:
             remote_dir = os.path.dirname(remote_path)
             self.mkdir_p(remote_dir)
             
-            # Get file size for logging
-            file_size = os.path.getsize(local_path)
             file_size_mb = file_size / (1024 * 1024)
             
             logger.info(f"Uploading {local_path} ({file_size_mb:.2f} MB) to {remote_path}...")
@@ -236,6 +246,94 @@ class SFTPClient:
         
         return results
 
+    def _upload_on_channel(self, channel: paramiko.SFTPClient, local_path: str, file_size: int,
+                           remote_dir: str) -> bool:
+        """Upload one file (of known size) over an extra SFTP channel with pipelined writes."""
+        remote_path = f"{remote_dir}/{os.path.basename(local_path)}"
+        try:
+            logger.info(f"Uploading {local_path} ({file_size / (1024 * 1024):.2f} MB) to {remote_path}...")
+
+            with open(local_path, 'rb') as local_file, channel.file(remote_path, 'wb') as remote_file:
+                # Don't wait for each write's ACK; close() collects them all
+                remote_file.set_pipelined(True)
+                while True:
+                    data = local_file.read(LOCAL_READ_SIZE)
+                    if not data:
+                        break
+                    for offset in range(0, len(data), WRITE_CHUNK_SIZE):
+                        remote_file.write(data[offset:offset + WRITE_CHUNK_SIZE])
+
+            remote_size = channel.stat(remote_path).st_size
+            if remote_size != file_size:
+                logger.error(f"Upload size mismatch: local={file_size}, remote={remote_size}")
+                return False
+            logger.info(f"✅ Successfully uploaded to {remote_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to upload {local_path}: {e}")
+            return False
+
+    def _upload_group(self, files: List[Tuple[str, int]], remote_dir: str) -> dict:
+        """Upload (path, size) pairs one after another on a dedicated SFTP channel."""
+        try:
+            channel = paramiko.SFTPClient.from_transport(self.ssh_client.get_transport())
+        except Exception as e:
+            logger.error(f"Failed to open SFTP channel: {e}")
+            return {os.path.basename(p): False for p, _ in files}
+
+        try:
+            return {
+                os.path.basename(p): self._upload_on_channel(channel, p, size, remote_dir)
+                for p, size in files
+            }
+        finally:
+            channel.close()
+
+    def upload_files_parallel(self, file_paths: List[str], max_channels: int = PARALLEL_CHANNELS,
+                              subfolder: Optional[str] = None) -> dict:
+        """
+        Upload multiple files concurrently over one SSH connection.
+
+        Each worker opens its own SFTP channel on the shared transport, so the
+        files upload side by side without extra logins.
+
+        Args:
+            file_paths: List of local file paths to upload into upload_path
+            max_channels: Maximum number of SFTP channels to open
+            subfolder: Optional subfolder within upload_path
+
+        Returns:
+            Dictionary with upload results: {filename: success_bool}
+        """
+        results = {}
+        existing = []
+        for local_path in file_paths:
+            try:
+                existing.append((local_path, os.stat(local_path).st_size))
+            except FileNotFoundError:
+                logger.error(f"Local file not found: {local_path}")
+                results[os.path.basename(local_path)] = False
+
+        if not existing:
+            return results
+
+        if not self.ensure_connection():
+            results.update({os.path.basename(p): False for p, _ in existing})
+            return results
+
+        remote_dir = f"{self.upload_path}/{subfolder}" if subfolder else self.upload_path
+        self.mkdir_p(remote_dir)
+
+        num_channels = min(max_channels, len(existing))
+        groups = [existing[i::num_channels] for i in range(num_channels)]
+        with ThreadPoolExecutor(max_workers=num_channels) as executor:
+            for group_results in executor.map(self._upload_group, groups, [remote_dir] * num_channels):
+                results.update(group_results)
+
+        # Report in the order the files were given
+        return {os.path.basename(p): results[os.path.basename(p)] for p in file_paths}
+
     def list_directory(self, remote_path: Optional[str] = None) -> List[str]:
         """
         List files in remote directory.
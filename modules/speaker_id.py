@@ -120,12 +120,12 @@ def enhance_formatted_transcript_with_names(transcript_text, committee_members):
                 # Keep as generic speaker if we run out of committee members
                 speaker_mapping[speaker_letter] = f"Speaker {speaker_letter}"
         
-        # Apply the mapping to the transcript
-        enhanced_transcript = transcript_text
-        for speaker_letter, name in speaker_mapping.items():
-            old_pattern = f"Speaker {speaker_letter}:"
-            new_pattern = f"{name}:"
-            enhanced_transcript = enhanced_transcript.replace(old_pattern, new_pattern)
+        # Apply the mapping to the transcript in a single pass over all labels
+        enhanced_transcript = re.sub(
+            speaker_pattern,
+            lambda m: f"{speaker_mapping[m.group(1)]}:",
+            transcript_text
+        )
         
         logger.info(f"Enhanced transcript with speaker mappings: {speaker_mapping}")
         return enhanced_transcript
@@ -14,9 +14,9 @@ import traceback
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from dotenv import load_dotenv
+from modules.env import load_env_once
 # Ensure .env is loaded for GRANITE_DEVICE and other settings
-load_dotenv()
+load_env_once()
 
 import librosa
 
@@ -27,6 +27,9 @@ from modules.video_processor import download_video, extract_audio_from_video
 
 logger = logging.getLogger(__name__)
 
+# Parakeet chunk length; 60-second chunks work well
+PARAKEET_CHUNK_SECONDS = 60
+
 
 class TranscriptPipeline:
     """
@@ -50,6 +53,9 @@ class TranscriptPipeline:
         self.event_detector = AudioEventDetector()
         self.formatter = TranscriptFormatter()
         self.uploader = TranscriptUploader()
+        # Models are created on first use (or by load_models) and kept for reuse
+        self._parakeet = None
+        self._diarizer = None
 
         logger.info(f"Pipeline initialized: transcriber={transcriber}, workers={num_workers}, device={self.device}")
 
@@ -64,19 +70,37 @@ class TranscriptPipeline:
         Returns:
             Transcribed text
         """
-        from modules.parakeet_transcription import ParakeetTranscriber
+        from modules.model_server import connect
+
+        parakeet_device = self._parakeet_device()
 
-        # Map device setting: 'cuda' -> 'cpu' for Parakeet (CPU is fast enough)
+        # Reuse a model held by a running model server (loaded with this
+        # pipeline's settings), else load it here
+        model_service = connect()
+        if model_service is not None:
+            logger.info(f"Transcribing with Parakeet via the model server (device={parakeet_device})")
+            return model_service.transcribe_parakeet(
+                os.path.abspath(audio_path), device=parakeet_device, chunk_duration=PARAKEET_CHUNK_SECONDS
+            )
+        logger.info(f"Transcribing with local Parakeet (device={parakeet_device})")
+        return self._get_parakeet().transcribe(audio_path)
+
+    def _parakeet_device(self) -> str:
+        """Map the pipeline device setting to a Parakeet device."""
+        # 'cuda' -> 'cpu' for Parakeet (CPU is fast enough)
         # 'migraphx' can be used for AMD GPU acceleration
-        parakeet_device = "cpu"
-        if self.device == "migraphx":
-            parakeet_device = "migraphx"
+        return "migraphx" if self.device == "migraphx" else "cpu"
 
-        transcriber = ParakeetTranscriber(
-            device=parakeet_device,
-            chunk_duration=60  # 60-second chunks work well
-        )
-        return transcriber.transcribe(audio_path)
+    def _get_parakeet(self):
+        """Return this pipeline's Parakeet transcriber, creating it on first use."""
+        if self._parakeet is None:
+            from modules.parakeet_transcription import ParakeetTranscriber
+
+            self._parakeet = ParakeetTranscriber(
+                device=self._parakeet_device(),
+                chunk_duration=PARAKEET_CHUNK_SECONDS
+            )
+        return self._parakeet
 
     def _transcribe_with_granite(self, audio_path: str) -> str:
         """
@@ -135,10 +159,40 @@ class TranscriptPipeline:
         Returns:
             List of speaker segments
         """
-        from modules.pyannote_diarization import PyannoteDiarizer
+        return self._get_diarizer().diarize(audio_path)
+
+    def _get_diarizer(self):
+        """Return this pipeline's Pyannote diarizer, creating it on first use."""
+        if self._diarizer is None:
+            from modules.pyannote_diarization import PyannoteDiarizer
+
+            self._diarizer = PyannoteDiarizer(device="cpu", max_speakers=25)
+        return self._diarizer
 
-        diarizer = PyannoteDiarizer(device="cpu", max_speakers=25)
-        return diarizer.diarize(audio_path)
+    def load_models(self):
+        """
+        Load the transcription and diarization models ahead of process_meeting.
+
+        Meant to run in the background while the audio is still being
+        downloaded or extracted. Failures are only logged; process_meeting
+        retries the load and applies its usual fallbacks.
+        """
+        from modules.model_server import connect
+
+        start = datetime.now()
+        if self.transcriber == "parakeet":
+            if connect() is not None:
+                logger.info("Model server running, skipping local Parakeet preload")
+            else:
+                try:
+                    self._get_parakeet().load_model()
+                except Exception as e:
+                    logger.warning(f"Parakeet preload failed: {e}")
+        try:
+            self._get_diarizer().load_pipeline()
+        except Exception as e:
+            logger.warning(f"Pyannote preload failed: {e}")
+        logger.info(f"Models preloaded in {(datetime.now() - start).total_seconds():.1f}s")
 
     def _align_transcript_with_diarization(
         self,
@@ -1,6 +1,8 @@
 import logging
 import gc
+import os
 from pathlib import Path
+from types import MappingProxyType
 
 # NOTE: WhisperX is currently not used (Sherpa-ONNX is primary)
 # Uncomment these imports if switching to WhisperX:
@@ -11,6 +13,44 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# pyannote.audio Pipeline class, imported on first diarization (pulls in torch)
+_pyannote_pipeline_cls = None
+
+
+def _get_pyannote_pipeline_cls():
+    """Import pyannote.audio once and cache its Pipeline class."""
+    global _pyannote_pipeline_cls
+    if _pyannote_pipeline_cls is None:
+        from pyannote.audio import Pipeline
+        _pyannote_pipeline_cls = Pipeline
+    return _pyannote_pipeline_cls
+
+# Returned by transcribe_with_whisperx when no transcription engine could run
+TRANSCRIPTION_FAILED_MESSAGE = "Transcription failed - Sherpa-ONNX system unavailable."
+
+# Map model sizes to faster-whisper format
+_MODEL_MAPPING = MappingProxyType({
+    "tiny": "tiny.en",
+    "base": "base.en",
+    "small": "small.en",
+    "medium": "base.en",      # Use base.en for faster processing
+    "large": "small.en",      # Use small.en for faster processing
+    "large-v2": "small.en",   # Use small.en for faster processing
+    "large-v3": "small.en"    # Use small.en for faster processing
+})
+
+def _format_segment(segment):
+    """Format a single transcript segment as a timestamped line."""
+    start_min, start_sec = divmod(int(segment.get("start", 0)), 60)
+    end_min, end_sec = divmod(int(segment.get("end", 0)), 60)
+    text = segment.get("text", "").strip()
+
+    if "speaker" in segment:
+        speaker = segment["speaker"]
+        return f"[{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}] {speaker}: {text}"
+    return f"[{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}] {text}"
+
+
 class WhisperXTranscriber:
     def __init__(self, model_size="large-v3", batch_size=16):
         self.model_size = model_size
@@ -74,7 +114,6 @@ class WhisperXTranscriber:
             
             # Speaker diarization (requires HF_TOKEN)
             try:
-                import os
                 hf_token = os.getenv("HF_TOKEN")
                 if hf_token:
                     logger.info("Performing speaker diarization...")
@@ -82,8 +121,7 @@ class WhisperXTranscriber:
                     # Load diarization model only once
                     if self.diarize_model is None:
                         logger.info("Loading speaker diarization model...")
-                        from pyannote.audio import Pipeline
-                        self.diarize_model = Pipeline.from_pretrained(
+                        self.diarize_model = _get_pyannote_pipeline_cls().from_pretrained(
                             "pyannote/speaker-diarization-3.1",
                             use_auth_token=hf_token
                         )
@@ -128,30 +166,7 @@ class WhisperXTranscriber:
             if not segments:
                 return "No transcription available."
             
-            transcript_lines = []
-            
-            for segment in segments:
-                start_time = segment.get("start", 0)
-                end_time = segment.get("end", 0)
-                text = segment.get("text", "").strip()
-                speaker = segment.get("speaker", "Unknown")
-                
-                # Format timestamp
-                start_min = int(start_time // 60)
-                start_sec = int(start_time % 60)
-                end_min = int(end_time // 60)
-                end_sec = int(end_time % 60)
-                
-                timestamp = f"[{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}]"
-                
-                if "speaker" in segment:
-                    line = f"{timestamp} {speaker}: {text}"
-                else:
-                    line = f"{timestamp} {text}"
-                
-                transcript_lines.append(line)
-            
-            return "\n".join(transcript_lines)
+            return "\n".join(_format_segment(segment) for segment in segments)
             
         except Exception as e:
             logger.error(f"Error formatting transcript: {e}")
@@ -213,18 +228,7 @@ def transcribe_with_whisperx(audio_path, model_size="medium", include_timestamps
     if engine == "whisper":
         logger.info(f"Using faster-whisper for transcription: {audio_path}")
     
-    # Map model sizes to faster-whisper format
-    model_mapping = {
-        "tiny": "tiny.en",
-        "base": "base.en", 
-        "small": "small.en",
-        "medium": "base.en",      # Use base.en for faster processing
-        "large": "small.en",      # Use small.en for faster processing
-        "large-v2": "small.en",   # Use small.en for faster processing
-        "large-v3": "small.en"    # Use small.en for faster processing
-    }
-    
-    whisper_model = model_mapping.get(model_size, "base.en")
+    whisper_model = _MODEL_MAPPING.get(model_size, "base.en")
     
     try:
         # Try Sherpa-ONNX approach first (most accurate, no authentication required)
@@ -248,4 +252,4 @@ def transcribe_with_whisperx(audio_path, model_size="medium", include_timestamps
     except Exception as e:
         logger.error(f"Sherpa-ONNX based transcription failed: {e}")
         logger.warning("No fallback transcription methods available. Please check Sherpa-ONNX setup.")
-        return "Transcription failed - Sherpa-ONNX system unavailable."
\ No newline at end of file
+        return TRANSCRIPTION_FAILED_MESSAGE
\ No newline at end of file
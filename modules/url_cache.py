@@ -0,0 +1,127 @@
+# modules/url_cache.py
+
+import os
+import json
+import mmap
+import time
+import sqlite3
+import hashlib
+import logging
+from contextlib import closing
+
+from config import URL_CACHE_FILE, TRANSCRIPT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_cache (
+    url_hash TEXT PRIMARY KEY,
+    video_path TEXT,
+    audio_path TEXT,
+    audio_sha TEXT,
+    created_at REAL
+)
+"""
+
+
+def url_key(url):
+    """Return the cache key for a meeting URL (sha256 hex digest)."""
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def audio_sha256(path):
+    """Hash an audio file's content; mmap lets large WAVs stream through the page cache."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def _connect():
+    """Open the cache database, creating the table on first use."""
+    conn = sqlite3.connect(URL_CACHE_FILE, timeout=10)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def get_cached_media(url):
+    """
+    Look up previously downloaded video/audio for a URL.
+
+    Returns:
+        Dict with video_path, audio_path and audio_sha, or None on a miss or
+        when either file has since been removed (e.g. by daily cleanup).
+    """
+    key = url_key(url)
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT video_path, audio_path, audio_sha FROM media_cache WHERE url_hash = ?",
+                (key,)
+            ).fetchone()
+            if not row:
+                return None
+
+            video_path, audio_path, audio_sha = row
+            if not (video_path and os.path.exists(video_path) and audio_path and os.path.exists(audio_path)):
+                logger.info(f"Cached media for {url} no longer on disk, dropping cache entry")
+                with conn:
+                    conn.execute("DELETE FROM media_cache WHERE url_hash = ?", (key,))
+                return None
+
+            return {'video_path': video_path, 'audio_path': audio_path, 'audio_sha': audio_sha}
+    except sqlite3.Error as e:
+        logger.warning(f"URL cache lookup failed: {e}")
+        return None
+
+
+def store_cached_media(url, video_path, audio_path, audio_sha=None):
+    """Record the downloaded video/audio paths for a URL."""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO media_cache "
+                "(url_hash, video_path, audio_path, audio_sha, created_at) VALUES (?, ?, ?, ?, ?)",
+                (url_key(url), video_path, audio_path, audio_sha, time.time())
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to update URL cache: {e}")
+
+
+def _transcript_cache_path(audio_sha):
+    return os.path.join(TRANSCRIPT_CACHE_DIR, f"{audio_sha}.json")
+
+
+def get_cached_transcript(audio_sha, settings):
+    """
+    Return the cached transcript for this audio content, or None.
+
+    The entry only counts as a hit when it was produced with the same
+    transcription settings (timestamps, model size, ...).
+    """
+    try:
+        with open(_transcript_cache_path(audio_sha), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable transcript cache entry {audio_sha}: {e}")
+        return None
+
+    if data.get('settings') != settings:
+        return None
+    return data.get('transcript')
+
+
+def store_cached_transcript(audio_sha, settings, transcript):
+    """Atomically write a transcript to the cache."""
+    path = _transcript_cache_path(audio_sha)
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'settings': settings, 'transcript': transcript}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to cache transcript {audio_sha}: {e}")
@@ -3,8 +3,9 @@
 import os
 import json
 import datetime
-import glob
 import logging
+import re
+import time
 
 from config import (
     ENTRIES_FILE, PROCESSED_ENTRIES_FILE, DOWNLOAD_DIR, CAPTIONS_DIR, LAST_CLEANUP_FILE
@@ -14,32 +15,56 @@ logger = logging.getLogger(__name__)
 
 # Removed global proxy_config and proxy_working
 
+# Entries whose text contains this phrase are skipped as test meetings
+_TEST_MEETING_RE = re.compile(r"test meeting", re.IGNORECASE)
+
+
+def _delete_directory_files(directory):
+    """
+    Delete the regular files directly inside a directory.
+
+    Uses a single scandir pass so each file costs one stat and one unlink.
+    Hidden files are left alone, matching the previous glob("*") behaviour.
+
+    Returns:
+        Tuple of (entries_found, deleted_count, total_size)
+    """
+    entries_found = 0
+    deleted_count = 0
+    total_size = 0
+
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                entries_found += 1
+                try:
+                    if entry.is_file():
+                        file_size = entry.stat().st_size
+                        os.unlink(entry.path)
+                        total_size += file_size
+                        deleted_count += 1
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Deleted: {entry.name} ({file_size / (1024*1024):.2f} MB)")
+
+                except Exception as e:
+                    logger.error(f"Error deleting {entry.path}: {e}")
+    except FileNotFoundError:
+        pass
+
+    return entries_found, deleted_count, total_size
+
 
 def cleanup_downloads_directory():
     """Delete all files in the downloads directory."""
     try:
-        files_pattern = os.path.join(DOWNLOAD_DIR, "*")
-        files_to_delete = glob.glob(files_pattern)
+        entries_found, deleted_count, total_size = _delete_directory_files(DOWNLOAD_DIR)
 
-        if not files_to_delete:
+        if not entries_found:
             logger.info("Downloads directory is already empty")
             return
 
-        deleted_count = 0
-        total_size = 0
-
-        for file_path in files_to_delete:
-            try:
-                if os.path.isfile(file_path):
-                    file_size = os.path.getsize(file_path)
-                    total_size += file_size
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.info(f"Deleted: {os.path.basename(file_path)} ({file_size / (1024*1024):.2f} MB)")
-
-            except Exception as e:
-                logger.error(f"Error deleting {file_path}: {e}")
-
         logger.info(f"Cleanup completed: {deleted_count} files deleted, {total_size / (1024*1024):.2f} MB freed")
 
         with open(LAST_CLEANUP_FILE, 'w') as f:
@@ -52,28 +77,12 @@ def cleanup_downloads_directory():
 def cleanup_captions_directory():
     """Delete all files in the captions directory."""
     try:
-        files_pattern = os.path.join(CAPTIONS_DIR, "*")
-        files_to_delete = glob.glob(files_pattern)
+        entries_found, deleted_count, total_size = _delete_directory_files(CAPTIONS_DIR)
 
-        if not files_to_delete:
+        if not entries_found:
             logger.info("Captions directory is already empty")
             return
 
-        deleted_count = 0
-        total_size = 0
-
-        for file_path in files_to_delete:
-            try:
-                if os.path.isfile(file_path):
-                    file_size = os.path.getsize(file_path)
-                    total_size += file_size
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.info(f"Deleted: {os.path.basename(file_path)} ({file_size / (1024*1024):.2f} MB)")
-
-            except Exception as e:
-                logger.error(f"Error deleting {file_path}: {e}")
-
         logger.info(f"Cleanup completed: {deleted_count} files deleted, {total_size / (1024*1024):.2f} MB freed")
 
         with open(LAST_CLEANUP_FILE, 'w') as f:
@@ -83,24 +92,40 @@ def cleanup_captions_directory():
         logger.error(f"Error during captions cleanup: {e}")
 
 
+# Last cleanup date read from LAST_CLEANUP_FILE, keyed by the file's mtime
+_LAST_CLEANUP_CACHE = {"mtime_ns": None, "date": None}
+
+
 def should_run_daily_cleanup():
     """Check if daily cleanup should be run."""
     try:
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        today = time.strftime('%Y-%m-%d')
         
-        if not os.path.exists(LAST_CLEANUP_FILE):
+        try:
+            mtime_ns = os.stat(LAST_CLEANUP_FILE).st_mtime_ns
+        except FileNotFoundError:
             return True
         
-        with open(LAST_CLEANUP_FILE, 'r') as f:
-            last_cleanup_date = f.read().strip()
+        if _LAST_CLEANUP_CACHE["mtime_ns"] != mtime_ns:
+            with open(LAST_CLEANUP_FILE, 'r') as f:
+                _LAST_CLEANUP_CACHE["date"] = f.read().strip()
+            _LAST_CLEANUP_CACHE["mtime_ns"] = mtime_ns
         
-        return last_cleanup_date != today
+        return _LAST_CLEANUP_CACHE["date"] != today
         
     except Exception as e:
         logger.error(f"Error checking cleanup date: {e}")
         return True
 
 
+def _write_json_atomic(path, data):
+    """Write JSON to a temp file and atomically swap it into place."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
 def read_stored_entries():
     """Read the previously stored entries."""
     if not os.path.exists(ENTRIES_FILE):
@@ -116,61 +141,98 @@ def read_stored_entries():
 
 def write_entries(entries):
     """Write entries to the storage file."""
-    with open(ENTRIES_FILE, 'w') as f:
-        json.dump(entries, f, indent=2)
+    _write_json_atomic(ENTRIES_FILE, entries)
+
+
+# Parsed processed entries, reused while the file's (mtime, size) is unchanged
+_PROCESSED_CACHE = {"mtime_ns": -1, "size": -1, "data": None}
+
+# Files written in this envelope have already been through the legacy
+# format migration below and can be returned without scanning each entry
+PROCESSED_ENTRIES_SCHEMA = 2
+
+
+def _migrate_processed_entries(entries):
+    """Validate legacy processed entries and convert old formats."""
+    valid_entries = []
+    for entry in entries:
+        if isinstance(entry, dict) and 'text' in entry:
+            # Convert old Google Docs format to new Nextcloud format if needed
+            if 'transcription' in entry:
+                transcription = entry['transcription']
+                if isinstance(transcription, dict):
+                    # Update old google_doc_url to nextcloud_result format
+                    if 'google_doc_url' in transcription and 'nextcloud_result' not in transcription:
+                        transcription['nextcloud_result'] = {
+                            'legacy_google_doc': transcription.pop('google_doc_url'),
+                            'migrated_to_nextcloud': True
+                        }
+            
+            valid_entries.append(entry)
+        else:
+            logger.warning(f"Skipping invalid entry format: {entry}")
+    
+    return valid_entries
+
+
+def _write_processed_entries(entries):
+    """Write processed entries in the current schema envelope and refresh the cache."""
+    _PROCESSED_CACHE["data"] = None
+    _write_json_atomic(PROCESSED_ENTRIES_FILE, {
+        '__schema__': PROCESSED_ENTRIES_SCHEMA,
+        'entries': entries
+    })
+    st = os.stat(PROCESSED_ENTRIES_FILE)
+    _PROCESSED_CACHE["mtime_ns"] = st.st_mtime_ns
+    _PROCESSED_CACHE["size"] = st.st_size
+    _PROCESSED_CACHE["data"] = entries
 
 
 def read_processed_entries():
     """Read the previously processed entries with error handling for format changes."""
-    if not os.path.exists(PROCESSED_ENTRIES_FILE):
+    try:
+        st = os.stat(PROCESSED_ENTRIES_FILE)
+    except FileNotFoundError:
         return []
     
+    if (_PROCESSED_CACHE["data"] is not None
+            and (st.st_mtime_ns, st.st_size) == (_PROCESSED_CACHE["mtime_ns"], _PROCESSED_CACHE["size"])):
+        return _PROCESSED_CACHE["data"]
+    
     try:
         with open(PROCESSED_ENTRIES_FILE, 'r') as f:
             content = f.read().strip()
             if not content:
                 return []
             
-            entries = json.loads(content)
-            
-            # Validate that entries is a list
-            if not isinstance(entries, list):
-                logger.error(f"Processed entries file contains invalid format (not a list), resetting...")
-                return []
-            
-            # Check if entries have expected structure and clean up if needed
-            valid_entries = []
-            for entry in entries:
-                if isinstance(entry, dict) and 'text' in entry:
-                    # Convert old Google Docs format to new Nextcloud format if needed
-                    if 'transcription' in entry:
-                        transcription = entry['transcription']
-                        if isinstance(transcription, dict):
-                            # Update old google_doc_url to nextcloud_result format
-                            if 'google_doc_url' in transcription and 'nextcloud_result' not in transcription:
-                                transcription['nextcloud_result'] = {
-                                    'legacy_google_doc': transcription.pop('google_doc_url'),
-                                    'migrated_to_nextcloud': True
-                                }
-                    
-                    valid_entries.append(entry)
-                else:
-                    logger.warning(f"Skipping invalid entry format: {entry}")
-            
-            return valid_entries
+            data = json.loads(content)
+        
+        # Current format - already migrated, skip the per-entry scan
+        if isinstance(data, dict) and data.get('__schema__', 0) >= PROCESSED_ENTRIES_SCHEMA:
+            entries = data.get('entries', [])
+            _PROCESSED_CACHE["mtime_ns"] = st.st_mtime_ns
+            _PROCESSED_CACHE["size"] = st.st_size
+            _PROCESSED_CACHE["data"] = entries
+            return entries
+        
+        # Validate that entries is a list
+        if not isinstance(data, list):
+            logger.error(f"Processed entries file contains invalid format (not a list), resetting...")
+            return []
+        
+        # Legacy format - migrate once and rewrite in the new envelope
+        logger.info(f"Migrating processed entries file to schema version {PROCESSED_ENTRIES_SCHEMA}")
+        valid_entries = _migrate_processed_entries(data)
+        try:
+            _write_processed_entries(valid_entries)
+        except Exception as write_error:
+            logger.error(f"Could not rewrite migrated processed entries: {write_error}")
+        return valid_entries
             
     except json.JSONDecodeError as e:
+        # Writes go through _write_json_atomic, so a partial file can only
+        # come from outside this module
         logger.error(f"Error parsing {PROCESSED_ENTRIES_FILE}: {e}")
-        logger.info(f"Backing up corrupted file and starting fresh...")
-        
-        # Backup the corrupted file
-        backup_file = f"{PROCESSED_ENTRIES_FILE}.backup.{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        try:
-            os.rename(PROCESSED_ENTRIES_FILE, backup_file)
-            logger.info(f"Backed up corrupted file to: {backup_file}")
-        except Exception as backup_error:
-            logger.error(f"Could not backup corrupted file: {backup_error}")
-        
         return []
     except Exception as e:
         logger.error(f"Unexpected error reading processed entries: {e}")
@@ -179,41 +241,50 @@ def read_processed_entries():
 
 def write_processed_entry(entry):
     """Add an entry to the processed entries file."""
-    processed = read_processed_entries()
+    # Copy so the cached list is untouched if the write fails
+    processed = list(read_processed_entries())
     processed.append(entry)
     
-    with open(PROCESSED_ENTRIES_FILE, 'w') as f:
-        json.dump(processed, f, indent=2)
+    _write_processed_entries(processed)
 
 
 def is_test_meeting(entry_text):
     """Check if an entry is a test meeting that should be skipped."""
-    # Convert to lowercase for case-insensitive matching
-    text_lower = entry_text.lower()
-
-    # Check for "test meeting" anywhere in the text
-    if "test meeting" in text_lower:
-        return True
-
-    return False
+    # Case-insensitive search for "test meeting" anywhere in the text,
+    # without allocating a lowercased copy of the whole entry
+    return _TEST_MEETING_RE.search(entry_text) is not None
 
 
 # Retry tracking for failed entries
 RETRY_COUNTS_FILE = os.path.join(os.path.dirname(ENTRIES_FILE), "retry_counts.json")
 MAX_RETRY_COUNT = 3
 
+# In-memory copy of the retry counts file, keyed by its mtime so the JSON is
+# only re-parsed when the file actually changes on disk
+_RETRY_CACHE = {"mtime": None, "data": None}
+
 
 def read_retry_counts():
     """Read the retry counts tracking file."""
-    if not os.path.exists(RETRY_COUNTS_FILE):
+    try:
+        mtime = os.stat(RETRY_COUNTS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        _RETRY_CACHE["mtime"] = None
+        _RETRY_CACHE["data"] = None
+        return {}
+    except Exception as e:
+        logger.error(f"Error reading retry counts: {e}")
         return {}
 
+    if _RETRY_CACHE["mtime"] == mtime and _RETRY_CACHE["data"] is not None:
+        return _RETRY_CACHE["data"]
+
     try:
         with open(RETRY_COUNTS_FILE, 'r') as f:
             content = f.read().strip()
             if not content:
                 return {}
-            return json.loads(content)
+            retry_counts = json.loads(content)
     except json.JSONDecodeError as e:
         logger.error(f"Error parsing {RETRY_COUNTS_FILE}: {e}")
         return {}
@@ -221,13 +292,21 @@ def read_retry_counts():
         logger.error(f"Error reading retry counts: {e}")
         return {}
 
+    _RETRY_CACHE["mtime"] = mtime
+    _RETRY_CACHE["data"] = retry_counts
+    return retry_counts
+
 
 def write_retry_counts(retry_counts):
     """Write retry counts to the tracking file."""
     try:
-        with open(RETRY_COUNTS_FILE, 'w') as f:
-            json.dump(retry_counts, f, indent=2)
+        _write_json_atomic(RETRY_COUNTS_FILE, retry_counts)
+        _RETRY_CACHE["mtime"] = os.stat(RETRY_COUNTS_FILE).st_mtime_ns
+        _RETRY_CACHE["data"] = retry_counts
     except Exception as e:
+        # Callers mutate the cached dict before writing, so drop it on failure
+        _RETRY_CACHE["mtime"] = None
+        _RETRY_CACHE["data"] = None
         logger.error(f"Error writing retry counts: {e}")
 
 
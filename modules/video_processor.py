@@ -2,18 +2,29 @@
 
 import os
 import re
+import asyncio
 import json
 import random
 import time
 import datetime
+import shutil
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yt_dlp
 
-from config import DOWNLOAD_DIR
+# Optional orjson import (faster JSON parsing, falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+from config import DOWNLOAD_DIR, YTDLP_CONCURRENT_FRAGMENTS, YTDLP_USE_ARIA2C
+from modules.web_scraper import make_request_with_proxy
 # Removed: from config import proxy_config, proxy_working # No longer needed
-# Removed: from modules.web_scraper import make_request_with_proxy # No longer needed, will pass proxy_manager
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +34,36 @@ logger = logging.getLogger(__name__)
 # of audio/video would be larger than this.
 MIN_VALID_FILE_SIZE = 1024
 
+# Range request size for yt-dlp. Downloads go through a high-latency proxy, so
+# smaller chunks combined with concurrent fragment downloads hide more latency
+# than a few large sequential ranges.
+HLS_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# aria2c is only used as yt-dlp's external downloader when explicitly enabled;
+# for single-file (non-fragmented) downloads it splits across connections
+ARIA2C_AVAILABLE = shutil.which('aria2c') is not None
+ARIA2C_ARGS = ['-x', '16', '-s', '16', '-k', '1M']
+
+# Patterns for locating the HLS stream on an entry page, compiled once. They
+# run over the raw response bytes so the page is never decoded as a whole.
+_AVAILABLE_STREAMS_RE = re.compile(rb'var\s+availableStreams\s*=\s*(\[.*?\]);', re.DOTALL)
+
+# Fallback URL patterns, most specific first, combined into one alternation so
+# the raw page bytes are scanned once. The group that matched (lastindex) gives
+# the pattern's priority; group 4 is the last-resort "any m3u8 URL" pattern.
+_FALLBACK_RE = re.compile(
+    # Pattern for VOD URLs with _definst_ and encoded title (most specific)
+    rb'(https?://[^"\'\s]+vod-2/_definst_/[^"\'\s]+\.mp4/playlist\.m3u8)'
+    # Pattern for any VOD URL
+    rb'|(https?://[^"\'\s]+vod[^"\'\s]*\.m3u8)'
+    # General m3u8 pattern but prioritize those with dates/times
+    rb'|(https?://[^"\'\s]+/\d{4}/\d{2}/\d{2}/[^"\'\s]+\.m3u8)'
+    # Last resort - any m3u8 URL
+    rb'|(https?://[^"\'\s]+\.m3u8)',
+    re.IGNORECASE
+)
+_FALLBACK_GROUPS = 4
+
 
 # Removed: get_proxy_status and get_proxy_url functions
 
@@ -34,37 +75,33 @@ def extract_hls_stream_url(entry_url, proxy_manager=None):
         
         # Use proxy-enabled request
         # Pass the proxy_manager instance to make_request_with_proxy
-        from modules.web_scraper import make_request_with_proxy # Import here to avoid circular dependency
         response = make_request_with_proxy(entry_url, proxy_manager=proxy_manager)
 
         # First try to find the availableStreams JSON data
-        available_streams_pattern = r'var\s+availableStreams\s*=\s*(\[.*?\]);'
-        available_streams_match = re.search(available_streams_pattern,
-                                            response.text,
-                                            re.DOTALL)
+        available_streams_match = _AVAILABLE_STREAMS_RE.search(response.content)
         if available_streams_match:
-            streams_json_str = available_streams_match.group(1)
+            # Both orjson and stdlib json accept the UTF-8 bytes directly
+            streams_json = available_streams_match.group(1)
             try:
-                streams_data = json.loads(streams_json_str)
-                logger.info(f"Found {len(streams_data)} streams in availableStreams JSON")
+                streams_data = _json_loads(streams_json)
+                logger.debug("Found %d streams in availableStreams JSON", len(streams_data))
                 
-                # Look for the best stream (non-live, enabled, with URL ending in .m3u8)
-                best_stream = None
-                for stream in streams_data:
-                    url = stream.get('Url', '')
-                    is_live = stream.get('IsLive', True)
-                    enabled = stream.get('Enabled', False)
-                    
-                    logger.info(f"Stream: URL={url[:80]}{'...' if len(url) > 80 else ''}, IsLive={is_live}, Enabled={enabled}")
-                    
-                    if url.endswith('.m3u8') and enabled and not is_live:
-                        # This is a good recorded stream
-                        best_stream = stream
-                        break
-                    elif url.endswith('.m3u8') and enabled:
-                        # Fallback to any enabled stream
-                        if best_stream is None:
-                            best_stream = stream
+                if logger.isEnabledFor(logging.DEBUG):
+                    for stream in streams_data:
+                        logger.debug("Stream: URL=%s, IsLive=%s, Enabled=%s",
+                                     stream.get('Url', '')[:80], stream.get('IsLive', True), stream.get('Enabled', False))
+                
+                # Look for the best stream (non-live, enabled, with URL ending in .m3u8),
+                # falling back to any enabled .m3u8 stream
+                best_stream = next(
+                    (s for s in streams_data
+                     if s.get('Url', '').endswith('.m3u8') and s.get('Enabled') and not s.get('IsLive', True)),
+                    None
+                ) or next(
+                    (s for s in streams_data
+                     if s.get('Url', '').endswith('.m3u8') and s.get('Enabled')),
+                    None
+                )
                 
                 if best_stream:
                     # Clean up the URL - replace escaped forward slashes but preserve URL encoding
@@ -77,45 +114,43 @@ def extract_hls_stream_url(entry_url, proxy_manager=None):
                     
             except json.JSONDecodeError as e:
                 logger.error(f"Could not parse availableStreams JSON: {e}")
-                logger.debug(f"JSON string was: {streams_json_str[:200]}...")
-
-        # Enhanced fallback patterns - look for VOD URLs first
-        vod_patterns = [
-            # Pattern for VOD URLs with _definst_ and encoded title (most specific)
-            r'(https?://[^"\'\s]+vod-2/_definst_/[^"\'\s]+\.mp4/playlist\.m3u8 )',
-            # Pattern for any VOD URL
-            r'(https?://[^"\'\s]+vod[^"\'\s]*\.m3u8 )',
-            # General m3u8 pattern but prioritize those with dates/times
-            r'(https?://[^"\'\s]+/\d{4}/\d{2}/\d{2}/[^"\'\s]+\.m3u8 )',
-        ]
-        
-        for i, pattern in enumerate(vod_patterns):
-            matches = re.findall(pattern, response.text, re.IGNORECASE)
+                logger.debug(f"JSON string was: {streams_json[:200].decode('utf-8', 'replace')}...")
+
+        # Enhanced fallback patterns - one pass over the page, bucketed by priority
+        buckets = [[] for _ in range(_FALLBACK_GROUPS)]
+        for m in _FALLBACK_RE.finditer(response.content):
+            buckets[m.lastindex - 1].append(m.group(m.lastindex))
+
+        # Look for VOD URLs first
+        for i, matches in enumerate(buckets[:-1]):
             if matches:
-                logger.info(f"Found {len(matches)} matches with pattern {i+1}")
+                logger.debug("Found %d matches with pattern %d", len(matches), i + 1)
                 # Filter out live streams if we have multiple matches
                 for match in matches:
-                    if 'live' not in match.lower():
-                        logger.info(f"Found VOD HLS URL via regex pattern {i+1}: {match}")
-                        return match
+                    if b'live' not in match.lower():
+                        hls_url = match.decode('utf-8', 'replace')
+                        logger.info(f"Found VOD HLS URL via regex pattern {i+1}: {hls_url}")
+                        return hls_url
                 # If all have 'live', take the first one
-                logger.info(f"Found HLS URL via regex pattern {i+1} (might be live): {matches[0]}")
-                return matches[0]
+                hls_url = matches[0].decode('utf-8', 'replace')
+                logger.info(f"Found HLS URL via regex pattern {i+1} (might be live): {hls_url}")
+                return hls_url
 
         # Last resort - any m3u8 URL
-        general_m3u8_pattern = r'(https?://[^"\'\s]+\.m3u8 )'
-        matches = re.findall(general_m3u8_pattern, response.text)
+        matches = buckets[-1]
         if matches:
-            logger.info(f"Found {len(matches)} m3u8 URLs as last resort")
+            logger.debug("Found %d m3u8 URLs as last resort", len(matches))
             # Filter out known live stream patterns
             for match in matches:
-                if '/live/' not in match and 'playlist.m3u8' in match:
-                    logger.info(f"Found potential HLS URL via fallback: {match}")
-                    return match
+                if b'/live/' not in match and b'playlist.m3u8' in match:
+                    hls_url = match.decode('utf-8', 'replace')
+                    logger.info(f"Found potential HLS URL via fallback: {hls_url}")
+                    return hls_url
             
             # If no good matches, return first one
-            logger.warning(f"Using first available HLS URL (may be live stream): {matches[0]}")
-            return matches[0]
+            hls_url = matches[0].decode('utf-8', 'replace')
+            logger.warning(f"Using first available HLS URL (may be live stream): {hls_url}")
+            return hls_url
 
         logger.error("No HLS stream URLs found on the page")
         return None
@@ -142,34 +177,40 @@ def download_hls_with_ytdlp(hls_url, output_file, max_retries=10, proxy_manager=
         proxy_attempts = max_retries
         total_attempt = 0
 
+        # Everything except the proxy is the same on every attempt
+        base_opts = {
+            'outtmpl': output_file.replace('.mp4', '.%(ext)s'),
+            'format': 'best[ext=mp4]/best',
+            'writesubtitles': False,
+            'writeautomaticsub': False,
+            'ignoreerrors': False,
+            'no_warnings': False,
+            'extractaudio': False,
+            'socket_timeout': 120,  # Increased timeout for video streams
+            'retries': 2,
+            'fragment_retries': 3,
+            'http_chunk_size': HLS_CHUNK_SIZE,
+            'hls_prefer_native': True,
+            'concurrent_fragment_downloads': YTDLP_CONCURRENT_FRAGMENTS,
+            'http_headers': {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            },
+        }
+        
+        if YTDLP_USE_ARIA2C and ARIA2C_AVAILABLE:
+            base_opts['external_downloader'] = 'aria2c'
+            base_opts['external_downloader_args'] = {'aria2c': ARIA2C_ARGS}
+
         # Try with proxy only
         if proxy_attempts > 0:
             logger.info(f"Phase 1: Trying {proxy_attempts} attempts with Oxylabs proxy")
+            proxy_url = proxy_manager.get_yt_dlp_proxy_url()
             for proxy_attempt in range(proxy_attempts):
                 total_attempt += 1
                 try:
-                    ydl_opts = {
-                        'outtmpl': output_file.replace('.mp4', '.%(ext)s'),
-                        'format': 'best[ext=mp4]/best',
-                        'writesubtitles': False,
-                        'writeautomaticsub': False,
-                        'ignoreerrors': False,
-                        'no_warnings': False,
-                        'extractaudio': False,
-                        'socket_timeout': 120,  # Increased timeout for video streams
-                        'retries': 2,
-                        'fragment_retries': 3,
-                        'http_chunk_size': 10485760,
-                        'hls_prefer_native': True,
-                    }
-                    
-                    ydl_opts['proxy'] = proxy_manager.get_yt_dlp_proxy_url()
+                    ydl_opts = {**base_opts, 'proxy': proxy_url}
                     logger.info(f"Attempt {total_attempt}: Using Oxylabs proxy {proxy_manager.proxy_config['ip']}:{proxy_manager.proxy_config['port']} with yt-dlp")
                     
-                    ydl_opts['http_headers'] = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    
                     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                         ydl.download([hls_url])
                     
@@ -194,8 +235,9 @@ def download_hls_with_ytdlp(hls_url, output_file, max_retries=10, proxy_manager=
                             logger.info("✅ Successfully obtained new proxy IP from Oxylabs")
                         else:
                             logger.warning("⚠️ Could not get new proxy IP, will retry with current config")
+                        proxy_url = proxy_manager.get_yt_dlp_proxy_url()
                         
-                        wait_time = 3 + random.uniform(1, 2)
+                        wait_time = 4 + random.random()
                         logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
                         time.sleep(wait_time)
                     else:
@@ -209,17 +251,39 @@ def download_hls_with_ytdlp(hls_url, output_file, max_retries=10, proxy_manager=
         return None
 
 
+def _valid_file_size(path):
+    """Return the file's size with a single stat, or None if missing or too small."""
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+    return size if size > MIN_VALID_FILE_SIZE else None
+
+
+# Containers yt-dlp may produce for a requested .mp4, in order of preference
+DOWNLOAD_EXTENSIONS = ('.mp4', '.mkv', '.webm', '.m4v')
+
+
 def check_download_success(output_file):
     """Check if download was successful and return the actual file path."""
-    possible_files = [
-        output_file,
-        output_file.replace('.mp4', '.mkv'),
-        output_file.replace('.mp4', '.webm'),
-        output_file.replace('.mp4', '.m4v')
-    ]
+    p = Path(output_file)
+    parent = p.parent
+    candidates = {p.stem + ext for ext in DOWNLOAD_EXTENSIONS}
+    
+    # One directory read instead of an exists + getsize pair per candidate
+    sizes = {}
+    try:
+        with os.scandir(parent) as it:
+            for entry in it:
+                if entry.name in candidates:
+                    sizes[entry.name] = entry.stat().st_size
+    except FileNotFoundError:
+        return None
     
-    for possible_file in possible_files:
-        if os.path.exists(possible_file) and os.path.getsize(possible_file) > MIN_VALID_FILE_SIZE:
+    for ext in DOWNLOAD_EXTENSIONS:
+        name = p.stem + ext
+        if sizes.get(name, 0) > MIN_VALID_FILE_SIZE:
+            possible_file = str(parent / name)
             if possible_file != output_file:
                 os.rename(possible_file, output_file)
                 return output_file
@@ -241,7 +305,7 @@ def download_with_ytdlp_fallback(hls_url, output_file, proxy_manager=None):
     return result
 
 
-def download_video(entry_url, proxy_manager=None):
+def download_video(entry_url, proxy_manager=None, video_filename=None):
     """Download video from the entry page using HLS stream extraction with yt-dlp."""
     try:
         hls_url = extract_hls_stream_url(entry_url, proxy_manager=proxy_manager)
@@ -249,10 +313,11 @@ def download_video(entry_url, proxy_manager=None):
             logger.error("Could not find HLS stream URL on the page")
             return None
         
-        video_filename = os.path.join(
-            DOWNLOAD_DIR, 
-            f"video_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-        )
+        if video_filename is None:
+            video_filename = os.path.join(
+                DOWNLOAD_DIR, 
+                f"video_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+            )
         
         return download_with_ytdlp_fallback(hls_url, video_filename, proxy_manager=proxy_manager)
     
@@ -261,6 +326,36 @@ def download_video(entry_url, proxy_manager=None):
         return None
 
 
+async def download_videos_async(entry_urls, proxy_manager=None, max_concurrent=3):
+    """
+    Download several entries' videos concurrently.
+
+    Each download_video call runs in a worker thread, so HLS fragment fetches
+    for different entries overlap instead of running back to back.
+
+    Args:
+        entry_urls: List of entry page URLs
+        proxy_manager: Shared ProxyManager instance
+        max_concurrent: Maximum number of simultaneous downloads
+
+    Returns:
+        List of downloaded file paths (None for failures), in input order
+    """
+    loop = asyncio.get_running_loop()
+    # One timestamp for the batch; the index keeps filenames unique
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        tasks = [
+            loop.run_in_executor(
+                executor, download_video, entry_url, proxy_manager,
+                os.path.join(DOWNLOAD_DIR, f"video_{timestamp}_{i}.mp4")
+            )
+            for i, entry_url in enumerate(entry_urls)
+        ]
+        return await asyncio.gather(*tasks)
+
+
 def extract_audio_from_video(video_path):
     """Extract audio from video file using ffmpeg directly (more reliable for local files)."""
     try:
@@ -274,17 +369,18 @@ def extract_audio_from_video(video_path):
         
         try:
             result = subprocess.run([
-                'ffmpeg', '-i', video_path, 
+                'ffmpeg', '-loglevel', 'error', '-i', video_path, 
                 '-vn',  # No video
                 '-acodec', 'libmp3lame',  # MP3 codec
                 '-ab', '192k',  # 192kbps bitrate
                 '-ar', '44100',  # Sample rate
                 '-y',  # Overwrite output file
                 audio_path
-            ], check=True, capture_output=True, text=True)
+            ], check=True, capture_output=True, stdin=subprocess.DEVNULL)
             
-            if os.path.exists(audio_path) and os.path.getsize(audio_path) > MIN_VALID_FILE_SIZE:
-                file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+            audio_size = _valid_file_size(audio_path)
+            if audio_size:
+                file_size_mb = audio_size / (1024 * 1024)
                 logger.info(f"Audio extracted successfully to {audio_path} (size: {file_size_mb:.2f} MB)")
                 return audio_path
             else:
@@ -292,7 +388,7 @@ def extract_audio_from_video(video_path):
                 return None
                 
         except subprocess.CalledProcessError as e:
-            logger.error(f"ffmpeg failed: {e.stderr}")
+            logger.error("ffmpeg failed: %s", e.stderr.decode('utf-8', 'replace'))
             return extract_audio_with_alternative_ffmpeg(video_path)
             
         except FileNotFoundError:
@@ -312,15 +408,16 @@ def extract_audio_with_alternative_ffmpeg(video_path):
         logger.info(f"Trying alternative ffmpeg method...")
         
         result = subprocess.run([
-            'ffmpeg', '-i', video_path, 
+            'ffmpeg', '-loglevel', 'error', '-i', video_path, 
             '-q:a', '2',  # High quality audio
             '-map', 'a',  # Map audio stream
             '-y',  # Overwrite
             audio_path
-        ], check=True, capture_output=True, text=True)
+        ], check=True, capture_output=True, stdin=subprocess.DEVNULL)
         
-        if os.path.exists(audio_path) and os.path.getsize(audio_path) > MIN_VALID_FILE_SIZE:
-            file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+        audio_size = _valid_file_size(audio_path)
+        if audio_size:
+            file_size_mb = audio_size / (1024 * 1024)
             logger.info(f"Audio extracted with alternative method to {audio_path} (size: {file_size_mb:.2f} MB)")
             return audio_path
         else:
@@ -1,11 +1,15 @@
 # modules/web_scraper.py
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import datetime
 import random
 import time
 import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 
 from config import URL
 # Removed: from config import proxy_config, proxy_working # No longer needed
@@ -13,10 +17,62 @@ from config import URL
 
 logger = logging.getLogger(__name__)
 
+# The listing page wraps each entry <table> in an <a>. libxml2 (the 'lxml'
+# backend) closes the <a> before a block-level <table>, which detaches every
+# entry from its link, so the pure-Python parser is kept deliberately.
+HTML_PARSER = 'html.parser'
+
+# Minimum retry wait per attempt (2 ** attempt + 1), plus up to 2s of jitter
+_BACKOFF_BASE = (2, 3, 5, 9, 17)
+
+# Scheme + host of the listing page, used to absolutize relative entry links
+BASE_URL = '/'.join(URL.split('/')[:3])
+
 
 # Removed: get_proxy_status and get_proxy_dict functions
 
 
+# Keep-alive sessions keyed by proxy URL, so the TLS/CONNECT tunnel through
+# Oxylabs is reused across retries and successive page fetches. Each proxy
+# refresh brings a new session URL, so only the most recently used
+# MAX_SESSIONS are kept; older ones are closed once no request is using them.
+MAX_SESSIONS = 4
+_SESSIONS = OrderedDict()
+_SESSIONS_IN_USE = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+@contextmanager
+def _pooled_session(proxy_url):
+    """Use the pooled requests.Session for the given proxy URL (thread-safe)."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(proxy_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSIONS[proxy_url] = session
+        else:
+            _SESSIONS.move_to_end(proxy_url)
+        _SESSIONS_IN_USE[session] = _SESSIONS_IN_USE.get(session, 0) + 1
+
+        while len(_SESSIONS) > MAX_SESSIONS:
+            _, evicted = _SESSIONS.popitem(last=False)
+            # One still in use is closed when its last request finishes
+            if evicted not in _SESSIONS_IN_USE:
+                evicted.close()
+    try:
+        yield session
+    finally:
+        with _SESSIONS_LOCK:
+            _SESSIONS_IN_USE[session] -= 1
+            if not _SESSIONS_IN_USE[session]:
+                del _SESSIONS_IN_USE[session]
+                if _SESSIONS.get(proxy_url) is not session:
+                    session.close()
+
+
 def make_request_with_proxy(url, headers=None, max_retries=3, proxy_manager=None):
     """Make a request using Oxylabs proxy with retry logic. Will NOT fallback to direct connection."""
     if headers is None:
@@ -31,12 +87,14 @@ def make_request_with_proxy(url, headers=None, max_retries=3, proxy_manager=None
         logger.error("Proxy is not available or not working. Cannot proceed without proxy to protect home IP.")
         raise Exception("Proxy not available - refusing to make direct connection to protect home IP")
 
+    proxies = proxy_manager.get_requests_proxy_dict()
+
     for attempt in range(max_retries):
         try:
-            proxies = proxy_manager.get_requests_proxy_dict()
             logger.info(f"Attempt {attempt + 1}: Using Oxylabs proxy {proxy_manager.proxy_config['ip']}:{proxy_manager.proxy_config['port']}")
             
-            response = requests.get(url, headers=headers, proxies=proxies, timeout=30)
+            with _pooled_session(proxies['https'] if proxies else None) as session:
+                response = session.get(url, headers=headers, proxies=proxies, timeout=(5, 30))
             
             response.raise_for_status()
             logger.info(f"Request successful on attempt {attempt + 1}")
@@ -55,9 +113,10 @@ def make_request_with_proxy(url, headers=None, max_retries=3, proxy_manager=None
                         logger.info("✅ Successfully obtained new proxy IP from Oxylabs")
                     else:
                         logger.warning("⚠️ Failed to get new proxy IP, will retry with current proxy")
+                    proxies = proxy_manager.get_requests_proxy_dict()
 
             if attempt < max_retries - 1:
-                wait_time = (2 ** attempt) + random.uniform(1, 3)
+                wait_time = _BACKOFF_BASE[min(attempt, len(_BACKOFF_BASE) - 1)] + random.random() * 2
                 logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
                 time.sleep(wait_time)
             else:
@@ -70,11 +129,13 @@ def get_current_entries(proxy_manager=None):
         # Use proxy-enabled request
         response = make_request_with_proxy(URL, proxy_manager=proxy_manager)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         
         entries = []
+        # All entries come from the same fetch, so they share one timestamp
+        timestamp = datetime.datetime.now().isoformat()
         
-        for entry_element in soup.select('table'):
+        for entry_element in soup.find_all('table'):
             entry_text = entry_element.get_text().strip()
             
             parent_a = entry_element.find_parent('a')
@@ -82,14 +143,13 @@ def get_current_entries(proxy_manager=None):
             if parent_a and 'href' in parent_a.attrs:
                 entry_link = parent_a['href']
                 if entry_link and not entry_link.startswith('http' ):
-                    base_url = '/'.join(URL.split('/')[:3])
-                    entry_link = f"{base_url}{entry_link if entry_link.startswith('/') else '/' + entry_link}"
+                    entry_link = f"{BASE_URL}{entry_link if entry_link.startswith('/') else '/' + entry_link}"
             
             if entry_text:
                 entries.append({
                     'text': entry_text,
                     'link': entry_link,
-                    'timestamp': datetime.datetime.now().isoformat()
+                    'timestamp': timestamp
                 })
         
         return entries
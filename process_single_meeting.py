@@ -5,6 +5,9 @@ Process a single legislature meeting video with enhanced Sherpa-ONNX transcripti
 and speaker identification. Similar to test_transcription.py but for production use.
 """
 
+import io
+import os
+import asyncio
 import logging
 import datetime
 import sys
@@ -15,13 +18,38 @@ from dotenv import load_dotenv
 # Load environment variables BEFORE importing config
 load_dotenv()
 
+from config import DOWNLOAD_DIR
 from modules.video_processor import download_video, extract_audio_from_video
-from modules.transcription import transcribe_with_whisperx
+from modules.transcription import transcribe_with_whisperx, TRANSCRIPTION_FAILED_MESSAGE
 from modules.speaker_id import get_committee_members_for_meeting
 from modules.nextcloud import save_transcript_to_nextcloud
 from modules.utils import write_processed_entry
+from modules.url_cache import (
+    get_cached_media, store_cached_media, audio_sha256,
+    get_cached_transcript, store_cached_transcript
+)
 import re
 
+# Speaker label patterns, compiled once (now using letters A, B, C, etc.)
+_SPEAKER_LINE_RE = re.compile(r'^(Speaker [A-Z]):\s*(.*)$')
+_SPEAKER_LABEL_RE = re.compile(r'Speaker ([A-Z]):')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+_FILENAME_UNSAFE_RE = re.compile(r'[^A-Za-z0-9]+')
+
+# Single meeting processing uses simplified settings:
+# - No committee rosters (generic Speaker A, Speaker B labels)
+# - No timestamps (cleaner, shorter transcripts)
+SINGLE_MEETING_COMMITTEE_MEMBERS = None
+SINGLE_MEETING_INCLUDE_TIMESTAMPS = False
+# Engine and model passed to transcribe_with_whisperx (its defaults); also
+# part of the transcript cache key
+SINGLE_MEETING_ENGINE = "canary"
+SINGLE_MEETING_MODEL_SIZE = "medium"
+
+# Meetings processed side by side by the batch runner (--batch)
+BATCH_MAX_CONCURRENT = 2
+
 def format_transcript_with_speaker_breaks(transcript_text):
     """
     Format transcript to add proper line breaks when speakers change.
@@ -37,51 +65,46 @@ def format_transcript_with_speaker_breaks(transcript_text):
         if not transcript_text:
             return transcript_text
         
-        # Split the text into lines
-        lines = transcript_text.split('\n')
-        formatted_lines = []
+        # Single pass, writing finished speaker blocks straight into a buffer
+        out = io.StringIO()
         current_speaker = None
         current_speaker_text = []
         
-        for line in lines:
+        for line in transcript_text.split('\n'):
             line = line.strip()
             if not line:
                 continue
             
-            # Check if this line starts with a speaker label (now using letters A, B, C, etc.)
-            speaker_match = re.match(r'^(Speaker [A-Z]):\s*(.*)$', line)
+            # Check if this line starts with a speaker label
+            speaker_match = _SPEAKER_LINE_RE.match(line)
             if speaker_match:
                 speaker_label = speaker_match.group(1)
-                text = speaker_match.group(2)
+                text = speaker_match.group(2).strip()
                 
                 # If we're switching speakers, finalize the previous speaker's text
                 if current_speaker and current_speaker != speaker_label:
                     if current_speaker_text:
-                        # Join all text for the current speaker and add it as one block
-                        combined_text = ' '.join(current_speaker_text)
-                        formatted_lines.append(f"{current_speaker}: {combined_text}")
-                        formatted_lines.append("")  # Add blank line between speakers
+                        # Join all text for the current speaker and add it as one block,
+                        # followed by a blank line between speakers
+                        out.write(f"{current_speaker}: {' '.join(current_speaker_text)}\n\n")
                         current_speaker_text = []
                 
                 # Update current speaker and add text
                 current_speaker = speaker_label
-                if text.strip():  # Only add non-empty text
-                    current_speaker_text.append(text.strip())
+                if text:  # Only add non-empty text
+                    current_speaker_text.append(text)
             else:
                 # This line doesn't start with a speaker label, add it to current speaker
-                if line.strip():  # Only add non-empty text
-                    current_speaker_text.append(line.strip())
+                current_speaker_text.append(line)
         
         # Don't forget the last speaker
         if current_speaker and current_speaker_text:
-            combined_text = ' '.join(current_speaker_text)
-            formatted_lines.append(f"{current_speaker}: {combined_text}")
+            out.write(f"{current_speaker}: {' '.join(current_speaker_text)}")
         
-        # Join all formatted lines
-        result = '\n'.join(formatted_lines)
+        result = out.getvalue()
         
         # Clean up any excessive whitespace
-        result = re.sub(r'\n{3,}', '\n\n', result)  # Replace 3+ newlines with 2
+        result = _EXCESS_NEWLINES_RE.sub('\n\n', result)  # Replace 3+ newlines with 2
         
         return result.strip()
         
@@ -101,16 +124,238 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def process_meeting_from_url(meeting_url, meeting_title, output_file=None, include_timestamps=True, save_to_nextcloud=True):
+async def _fetch_media(meeting_url, video_filename=None):
+    """
+    Stage 1: download the video and extract its audio, or reuse cached media.
+
+    video_filename gives concurrent batch downloads distinct file names
+    (download_video otherwise names files by the current second).
+
+    Returns:
+        Tuple of (video_path, audio_path, audio_sha), or None on failure
+    """
+    cached = get_cached_media(meeting_url)
+    if cached:
+        # Same URL already downloaded and decoded, skip straight to transcription
+        video_path = cached['video_path']
+        audio_path = cached['audio_path']
+        audio_sha = cached['audio_sha'] or await asyncio.to_thread(audio_sha256, audio_path)
+        logger.info(f"♻️  Reusing cached media: {video_path}, {audio_path}")
+        return video_path, audio_path, audio_sha
+
+    # Download video
+    logger.info("📥 Downloading video...")
+    video_path = await asyncio.to_thread(download_video, meeting_url, video_filename=video_filename)
+    if not video_path:
+        logger.error("Failed to download video")
+        return None
+    logger.info(f"✅ Video downloaded: {video_path}")
+    
+    # Extract audio
+    logger.info("🎵 Extracting audio...")
+    audio_path = await asyncio.to_thread(extract_audio_from_video, video_path)
+    if not audio_path:
+        logger.error("Failed to extract audio")
+        return None
+    logger.info(f"✅ Audio extracted: {audio_path}")
+    audio_sha = await asyncio.to_thread(audio_sha256, audio_path)
+    store_cached_media(meeting_url, video_path, audio_path, audio_sha)
+    return video_path, audio_path, audio_sha
+
+async def _transcribe_audio(audio_path, audio_sha):
+    """
+    Stage 2: transcribe with speaker diarization (or reuse a cached transcript).
+
+    Returns:
+        Tuple of (enhanced_transcript, processing_time); the transcript is
+        empty/None on failure
+    """
+    logger.info("Using simplified transcription settings for single meeting processing:")
+    logger.info("  • Generic speaker labels (Speaker 0, Speaker 1, etc.)")
+    logger.info("  • No timestamps (cleaner format)")
+    
+    # Start timing for transcription
+    start_time = datetime.datetime.now()
+    
+    # Reuse the transcript if this exact audio was transcribed before
+    transcript_settings = {
+        'engine': SINGLE_MEETING_ENGINE,
+        'model_size': SINGLE_MEETING_MODEL_SIZE,
+        'include_timestamps': SINGLE_MEETING_INCLUDE_TIMESTAMPS,
+        'committee_members': SINGLE_MEETING_COMMITTEE_MEMBERS
+    }
+    enhanced_transcript = get_cached_transcript(audio_sha, transcript_settings)
+    if enhanced_transcript:
+        logger.info(f"♻️  Using cached transcript for audio {audio_sha[:12]}")
+    else:
+        # Transcribe with simplified settings
+        logger.info(f"🎤 Starting enhanced transcription with Sherpa-ONNX speaker diarization...")
+        enhanced_transcript = await asyncio.to_thread(
+            transcribe_with_whisperx,
+            audio_path,
+            model_size=SINGLE_MEETING_MODEL_SIZE,
+            include_timestamps=SINGLE_MEETING_INCLUDE_TIMESTAMPS,
+            committee_members=SINGLE_MEETING_COMMITTEE_MEMBERS,
+            engine=SINGLE_MEETING_ENGINE
+        )
+        if enhanced_transcript and enhanced_transcript != TRANSCRIPTION_FAILED_MESSAGE:
+            store_cached_transcript(audio_sha, transcript_settings, enhanced_transcript)
+    
+    # End timing and log results
+    end_time = datetime.datetime.now()
+    return enhanced_transcript, end_time - start_time
+
+async def _finish_meeting(meeting_url, meeting_title, media, enhanced_transcript, processing_time,
+                          output_file=None, save_to_nextcloud=True):
+    """
+    Stage 3: format the transcript, save it locally/to Nextcloud and record
+    the processed entry.
+
+    Returns:
+        Dict with processing results
+    """
+    video_path, audio_path, _ = media
+    committee_members = SINGLE_MEETING_COMMITTEE_MEMBERS
+    include_timestamps = SINGLE_MEETING_INCLUDE_TIMESTAMPS
+    
+    # Format transcript with proper speaker breaks
+    logger.info("📝 Formatting transcript with proper speaker breaks...")
+    formatted_transcript = format_transcript_with_speaker_breaks(enhanced_transcript)
+    
+    # Log transcription results
+    logger.info(f"✅ Transcription completed successfully!")
+    logger.info(f"⏱️  Processing time: {processing_time}")
+    logger.info(f"📄 Original transcript length: {len(enhanced_transcript)} characters")
+    logger.info(f"📄 Formatted transcript length: {len(formatted_transcript)} characters")
+    
+    # Count detected speakers in the formatted transcript
+    # Since we're using generic labels for single meeting processing (now with letters)
+    speaker_letters = set(_SPEAKER_LABEL_RE.findall(formatted_transcript))
+    unique_speakers = len(speaker_letters)
+    speaker_labels = [f"Speaker {letter}" for letter in sorted(speaker_letters)]
+    logger.info(f"🎭 Detected speakers: {unique_speakers} ({', '.join(speaker_labels)})")
+    
+    # Single "processed at" time shared by the output file, results and entry log
+    now = datetime.datetime.now()
+    now_iso = now.isoformat()
+    
+    # Save to local file if requested
+    if output_file:
+        output_path = Path(output_file)
+        header = "".join([
+            "Meeting Processing Results\n",
+            "========================\n\n",
+            f"Meeting: {meeting_title}\n",
+            f"URL: {meeting_url}\n",
+            f"Video: {video_path}\n",
+            f"Audio: {audio_path}\n",
+            f"Processing time: {processing_time}\n",
+            f"Committee members: {len(committee_members) if committee_members else 0}\n",
+            f"Detected speakers: {unique_speakers}\n",
+            f"Speaker labels: {', '.join(speaker_labels)}\n",
+            f"Original transcript length: {len(enhanced_transcript)} characters\n",
+            f"Formatted transcript length: {len(formatted_transcript)} characters\n",
+            f"Generated: {now}\n\n",
+            "TRANSCRIPT:\n",
+            "===========\n\n",
+        ])
+        # Large buffer so the header and transcript reach disk in few writes
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(header)
+            f.write(formatted_transcript)
+        logger.info(f"💾 Local transcript saved to: {output_path}")
+    
+    # Save to Nextcloud if requested
+    nextcloud_result = None
+    if save_to_nextcloud:
+        logger.info("☁️  Saving to Nextcloud...")
+        clean_title = _WHITESPACE_RE.sub(' ', meeting_title).strip()
+        nextcloud_result = await asyncio.to_thread(
+            save_transcript_to_nextcloud,
+            formatted_transcript, clean_title, meeting_url
+        )
+        if nextcloud_result:
+            logger.info(f"✅ Nextcloud upload successful!")
+            logger.info(f"📁 Path: {nextcloud_result.get('nextcloud_path', 'Unknown')}")
+            logger.info(f"🔗 Share: {nextcloud_result.get('share_link', 'No link')}")
+        else:
+            logger.error("❌ Nextcloud upload failed")
+    
+    # Prepare results
+    results = {
+        'success': True,
+        'meeting_title': meeting_title,
+        'meeting_url': meeting_url,
+        'video_path': video_path,
+        'audio_path': audio_path,
+        'transcript': formatted_transcript,
+        'processing_time': processing_time,
+        'committee_members_count': len(committee_members) if committee_members else 0,
+        'speakers_detected': speaker_labels,
+        'speakers_count': unique_speakers,
+        'transcript_length': len(formatted_transcript),
+        'original_transcript_length': len(enhanced_transcript),
+        'nextcloud_result': nextcloud_result,
+        'processed_at': now_iso
+    }
+    
+    # Save processing entry for records
+    entry = {
+        'text': meeting_title,
+        'link': meeting_url,
+        'timestamp': now_iso,
+        'transcription': {
+            'video_path': video_path,
+            'audio_path': audio_path,
+            'nextcloud_result': nextcloud_result,
+            'processed_at': now_iso,
+            'processing_time_seconds': processing_time.total_seconds(),
+            'transcript_length': len(formatted_transcript),
+            'original_transcript_length': len(enhanced_transcript),
+            'committee_members_count': len(committee_members) if committee_members else 0,
+            'speakers_detected': speaker_labels,
+            'speakers_count': unique_speakers,
+            'speaker_diarization': 'Sherpa-ONNX',
+            'include_timestamps': include_timestamps,
+            'processing_mode': 'single_meeting_simplified'
+        }
+    }
+    write_processed_entry(entry)
+    
+    # Final success summary
+    logger.info("=" * 70)
+    logger.info("🎉 SINGLE MEETING PROCESSING COMPLETE!")
+    logger.info(f"📊 Mode: Single meeting simplified processing")
+    logger.info(f"🎭 Speakers: {unique_speakers} detected")
+    logger.info(f"👥 Labels: {', '.join(speaker_labels)}")
+    logger.info(f"⏱️  Time: {processing_time}")
+    logger.info(f"📄 Length: {len(formatted_transcript)} characters (formatted)")
+    logger.info(f"🏷️  Format: No timestamps, generic speaker labels, proper line breaks")
+    if nextcloud_result:
+        logger.info(f"☁️  Saved to: {nextcloud_result.get('nextcloud_path', 'Unknown')}")
+        logger.info(f"🔗 Share: {nextcloud_result.get('share_link', 'No link')}")
+    if output_file:
+        logger.info(f"💾 Local: {output_file}")
+    logger.info("=" * 70)
+    
+    return results
+
+async def process_meeting_from_url(meeting_url, meeting_title, output_file=None, include_timestamps=True, save_to_nextcloud=True,
+                                   video_filename=None):
     """
     Process a single meeting from URL with full pipeline.
+
+    Download, audio extraction and transcription run in worker threads, so
+    several meetings can be processed concurrently (see process_meetings).
     
     Args:
         meeting_url: URL to the meeting video
         meeting_title: Title of the meeting (e.g., "IC - Legislative Finance")
         output_file: Optional local file to save transcript
-        include_timestamps: Whether to include timestamps in output
+        include_timestamps: Ignored; single meetings are always transcribed
+            without timestamps (SINGLE_MEETING_INCLUDE_TIMESTAMPS)
         save_to_nextcloud: Whether to save to Nextcloud
+        video_filename: Optional path for the downloaded video
         
     Returns:
         Dict with processing results
@@ -120,175 +365,189 @@ def process_meeting_from_url(meeting_url, meeting_title, output_file=None, inclu
         logger.info(f"📺 Meeting: {meeting_title}")
         logger.info(f"🔗 URL: {meeting_url}")
         
-        # Download video
-        logger.info("📥 Downloading video...")
-        video_path = download_video(meeting_url)
-        if not video_path:
-            logger.error("Failed to download video")
-            return None
-        logger.info(f"✅ Video downloaded: {video_path}")
-        
-        # Extract audio
-        logger.info("🎵 Extracting audio...")
-        audio_path = extract_audio_from_video(video_path)
-        if not audio_path:
-            logger.error("Failed to extract audio")
+        media = await _fetch_media(meeting_url, video_filename=video_filename)
+        if not media:
             return None
-        logger.info(f"✅ Audio extracted: {audio_path}")
-        
-        # For single meeting processing, use simplified settings:
-        # - No committee rosters (generic Speaker 0, Speaker 1 labels)  
-        # - No timestamps (cleaner, shorter transcripts)
-        committee_members = None  # Don't use rosters for single meeting processing
-        include_timestamps = False  # Don't include timestamps for single meeting processing
-        
-        logger.info("Using simplified transcription settings for single meeting processing:")
-        logger.info("  • Generic speaker labels (Speaker 0, Speaker 1, etc.)")
-        logger.info("  • No timestamps (cleaner format)")
-        
-        # Start timing for transcription
-        start_time = datetime.datetime.now()
-        
-        # Transcribe with simplified settings
-        logger.info(f"🎤 Starting enhanced transcription with Sherpa-ONNX speaker diarization...")
-        enhanced_transcript = transcribe_with_whisperx(
-            audio_path,
-            include_timestamps=include_timestamps,
-            committee_members=committee_members
-        )
-        
-        # End timing and log results
-        end_time = datetime.datetime.now()
-        processing_time = end_time - start_time
         
+        enhanced_transcript, processing_time = await _transcribe_audio(media[1], media[2])
         if not enhanced_transcript:
             logger.error("❌ Failed to transcribe audio")
             return None
         
-        # Format transcript with proper speaker breaks
-        logger.info("📝 Formatting transcript with proper speaker breaks...")
-        formatted_transcript = format_transcript_with_speaker_breaks(enhanced_transcript)
-        
-        # Log transcription results
-        logger.info(f"✅ Transcription completed successfully!")
-        logger.info(f"⏱️  Processing time: {processing_time}")
-        logger.info(f"📄 Original transcript length: {len(enhanced_transcript)} characters")
-        logger.info(f"📄 Formatted transcript length: {len(formatted_transcript)} characters")
-        
-        # Count detected speakers in the formatted transcript
-        # Since we're using generic labels for single meeting processing (now with letters)
-        speaker_pattern = r'Speaker ([A-Z]):'
-        speakers_found_matches = re.findall(speaker_pattern, formatted_transcript)
-        unique_speakers = len(set(speakers_found_matches))
-        speaker_labels = [f"Speaker {letter}" for letter in sorted(set(speakers_found_matches))]
-        logger.info(f"🎭 Detected speakers: {unique_speakers} ({', '.join(speaker_labels)})")
-        
-        # Save to local file if requested
-        if output_file:
-            output_path = Path(output_file)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"Meeting Processing Results\n")
-                f.write(f"========================\n\n")
-                f.write(f"Meeting: {meeting_title}\n")
-                f.write(f"URL: {meeting_url}\n")
-                f.write(f"Video: {video_path}\n")
-                f.write(f"Audio: {audio_path}\n")
-                f.write(f"Processing time: {processing_time}\n")
-                f.write(f"Committee members: {len(committee_members) if committee_members else 0}\n")
-                f.write(f"Detected speakers: {unique_speakers}\n")
-                f.write(f"Speaker labels: {', '.join(speaker_labels)}\n")
-                f.write(f"Original transcript length: {len(enhanced_transcript)} characters\n")
-                f.write(f"Formatted transcript length: {len(formatted_transcript)} characters\n")
-                f.write(f"Generated: {datetime.datetime.now()}\n\n")
-                f.write("TRANSCRIPT:\n")
-                f.write("===========\n\n")
-                f.write(formatted_transcript)
-            logger.info(f"💾 Local transcript saved to: {output_path}")
-        
-        # Save to Nextcloud if requested
-        nextcloud_result = None
-        if save_to_nextcloud:
-            logger.info("☁️  Saving to Nextcloud...")
-            clean_title = re.sub(r'\s+', ' ', meeting_title).strip()
-            nextcloud_result = save_transcript_to_nextcloud(
-                formatted_transcript, clean_title, meeting_url
-            )
-            if nextcloud_result:
-                logger.info(f"✅ Nextcloud upload successful!")
-                logger.info(f"📁 Path: {nextcloud_result.get('nextcloud_path', 'Unknown')}")
-                logger.info(f"🔗 Share: {nextcloud_result.get('share_link', 'No link')}")
-            else:
-                logger.error("❌ Nextcloud upload failed")
-        
-        # Prepare results
-        results = {
-            'success': True,
-            'meeting_title': meeting_title,
-            'meeting_url': meeting_url,
-            'video_path': video_path,
-            'audio_path': audio_path,
-            'transcript': formatted_transcript,
-            'processing_time': processing_time,
-            'committee_members_count': len(committee_members) if committee_members else 0,
-            'speakers_detected': speaker_labels,
-            'speakers_count': unique_speakers,
-            'transcript_length': len(formatted_transcript),
-            'original_transcript_length': len(enhanced_transcript),
-            'nextcloud_result': nextcloud_result,
-            'processed_at': datetime.datetime.now().isoformat()
-        }
-        
-        # Save processing entry for records
-        entry = {
-            'text': meeting_title,
-            'link': meeting_url,
-            'timestamp': datetime.datetime.now().isoformat(),
-            'transcription': {
-                'video_path': video_path,
-                'audio_path': audio_path,
-                'nextcloud_result': nextcloud_result,
-                'processed_at': datetime.datetime.now().isoformat(),
-                'processing_time_seconds': processing_time.total_seconds(),
-                'transcript_length': len(formatted_transcript),
-                'original_transcript_length': len(enhanced_transcript),
-                'committee_members_count': len(committee_members) if committee_members else 0,
-                'speakers_detected': speaker_labels,
-                'speakers_count': unique_speakers,
-                'speaker_diarization': 'Sherpa-ONNX',
-                'include_timestamps': include_timestamps,
-                'processing_mode': 'single_meeting_simplified'
-            }
-        }
-        write_processed_entry(entry)
-        
-        # Final success summary
-        logger.info("=" * 70)
-        logger.info("🎉 SINGLE MEETING PROCESSING COMPLETE!")
-        logger.info(f"📊 Mode: Single meeting simplified processing")
-        logger.info(f"🎭 Speakers: {unique_speakers} detected")
-        logger.info(f"👥 Labels: {', '.join(speaker_labels)}")
-        logger.info(f"⏱️  Time: {processing_time}")
-        logger.info(f"📄 Length: {len(formatted_transcript)} characters (formatted)")
-        logger.info(f"🏷️  Format: No timestamps, generic speaker labels, proper line breaks")
-        if nextcloud_result:
-            logger.info(f"☁️  Saved to: {nextcloud_result.get('nextcloud_path', 'Unknown')}")
-            logger.info(f"🔗 Share: {nextcloud_result.get('share_link', 'No link')}")
-        if output_file:
-            logger.info(f"💾 Local: {output_file}")
-        logger.info("=" * 70)
-        
-        return results
+        return await _finish_meeting(
+            meeting_url, meeting_title, media, enhanced_transcript, processing_time,
+            output_file=output_file, save_to_nextcloud=save_to_nextcloud
+        )
             
     except Exception as e:
         logger.error(f"Error processing meeting: {e}")
         return None
 
+def read_meeting_list(path):
+    """
+    Read a batch file with one meeting per line: the URL, whitespace, then
+    the title. Blank lines and lines starting with '#' are skipped.
+
+    Returns:
+        List of (meeting_url, meeting_title) pairs
+    """
+    meetings = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split(None, 1)
+            if len(parts) != 2:
+                raise ValueError(f"{path}:{line_number}: expected '<url> <title>'")
+            meetings.append((parts[0], parts[1]))
+    return meetings
+
+def _batch_file_names(meetings, output_dir=None):
+    """
+    Per-meeting (output_file, video_filename) pairs for a batch, so meetings
+    running side by side never share a transcript or video file.
+    """
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    names = []
+    for index, (_, meeting_title) in enumerate(meetings, 1):
+        output_file = None
+        if output_dir:
+            slug = _FILENAME_UNSAFE_RE.sub('_', meeting_title).strip('_') or 'meeting'
+            output_file = os.path.join(output_dir, f"{index:02d}_{slug}.txt")
+        names.append((output_file, os.path.join(DOWNLOAD_DIR, f"video_{timestamp}_{index}.mp4")))
+    return names
+
+async def _process_meetings_pipelined(meetings, output_dir=None, save_to_nextcloud=True):
+    """
+    Run meetings through the three stages as a pipeline: while meeting N is
+    transcribed, meeting N+1 downloads and meeting N-1 is formatted/uploaded.
+    Stages hand off through single-slot queues, so at most one meeting waits
+    between any two stages and only one transcription runs at a time.
+
+    Args and return value as for process_meetings.
+    """
+    file_names = _batch_file_names(meetings, output_dir)
+    results = [None] * len(meetings)
+    media_queue = asyncio.Queue(maxsize=1)
+    transcript_queue = asyncio.Queue(maxsize=1)
+
+    async def fetch_worker():
+        for index, (meeting_url, meeting_title) in enumerate(meetings):
+            logger.info(f"🚀 [{index + 1}/{len(meetings)}] {meeting_title} ({meeting_url})")
+            try:
+                media = await _fetch_media(meeting_url, video_filename=file_names[index][1])
+            except Exception as e:
+                logger.error(f"Error fetching media for {meeting_url}: {e}")
+                media = None
+            if media:
+                await media_queue.put((index, media))
+        await media_queue.put(None)
+
+    async def transcribe_worker():
+        while (item := await media_queue.get()) is not None:
+            index, media = item
+            try:
+                enhanced_transcript, processing_time = await _transcribe_audio(media[1], media[2])
+            except Exception as e:
+                logger.error(f"Error transcribing {meetings[index][0]}: {e}")
+                continue
+            if not enhanced_transcript:
+                logger.error(f"❌ Failed to transcribe audio for {meetings[index][0]}")
+                continue
+            await transcript_queue.put((index, media, enhanced_transcript, processing_time))
+        await transcript_queue.put(None)
+
+    async def finish_worker():
+        while (item := await transcript_queue.get()) is not None:
+            index, media, enhanced_transcript, processing_time = item
+            meeting_url, meeting_title = meetings[index]
+            try:
+                results[index] = await _finish_meeting(
+                    meeting_url, meeting_title, media, enhanced_transcript, processing_time,
+                    output_file=file_names[index][0], save_to_nextcloud=save_to_nextcloud
+                )
+            except Exception as e:
+                logger.error(f"Error processing meeting: {e}")
+
+    await asyncio.gather(fetch_worker(), transcribe_worker(), finish_worker())
+    return results
+
+async def process_meetings(meetings, max_concurrent=BATCH_MAX_CONCURRENT, output_dir=None, save_to_nextcloud=True,
+                           pipeline=False):
+    """
+    Process several meetings concurrently so one meeting's download overlaps
+    another's transcription.
+
+    Args:
+        meetings: List of (meeting_url, meeting_title) pairs
+        max_concurrent: Maximum number of meetings in flight at once
+        output_dir: Optional directory for the local transcripts, one file
+            per meeting
+        save_to_nextcloud: Whether to save each transcript to Nextcloud
+        pipeline: Run meetings through stage queues (download -> transcribe ->
+            format/upload) instead of whole meetings side by side;
+            max_concurrent does not apply
+
+    Returns:
+        List of results (None for failures) in input order
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if pipeline:
+        return await _process_meetings_pipelined(meetings, output_dir=output_dir, save_to_nextcloud=save_to_nextcloud)
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _bounded(meeting, names):
+        meeting_url, meeting_title = meeting
+        output_file, video_filename = names
+        async with semaphore:
+            return await process_meeting_from_url(
+                meeting_url, meeting_title, output_file=output_file,
+                save_to_nextcloud=save_to_nextcloud, video_filename=video_filename
+            )
+
+    return await asyncio.gather(*(
+        _bounded(meeting, names) for meeting, names in zip(meetings, _batch_file_names(meetings, output_dir))
+    ))
+
+def run_batch(args):
+    """Process every meeting in args.batch and print a summary; returns True if all succeeded."""
+    meetings = read_meeting_list(args.batch)
+    logger.info(f"=== Batch Meeting Processor: {len(meetings)} meetings ===")
+
+    results = asyncio.run(process_meetings(
+        meetings,
+        max_concurrent=args.max_concurrent,
+        output_dir=args.output_dir,
+        save_to_nextcloud=not args.no_nextcloud,
+        pipeline=args.pipeline
+    ))
+
+    print("\n" + "="*60)
+    print(f"📊 Batch Summary: {sum(1 for r in results if r)}/{len(meetings)} meetings processed")
+    print("="*60)
+    for (meeting_url, meeting_title), result in zip(meetings, results):
+        if result:
+            print(f"   ✅ {meeting_title}: {result['speakers_count']} speakers, {result['transcript_length']} characters")
+        else:
+            print(f"   ❌ {meeting_title}: failed ({meeting_url})")
+    return all(results)
+
 def main():
     """Main function for single meeting processing."""
     parser = argparse.ArgumentParser(description='Process Single Legislature Meeting')
-    parser.add_argument('meeting_url', help='URL to the meeting video')
-    parser.add_argument('meeting_title', help='Meeting title (e.g., "IC - Legislative Finance")')
+    parser.add_argument('meeting_url', nargs='?', help='URL to the meeting video')
+    parser.add_argument('meeting_title', nargs='?', help='Meeting title (e.g., "IC - Legislative Finance")')
     parser.add_argument('--output', type=str, help='Output file to save transcript locally')
+    parser.add_argument('--batch', type=str,
+                       help='Process every meeting listed in this file ("<url> <title>" per line)')
+    parser.add_argument('--output-dir', type=str,
+                       help='With --batch: directory for one local transcript per meeting')
+    parser.add_argument('--max-concurrent', type=int, default=BATCH_MAX_CONCURRENT,
+                       help=f'With --batch: meetings processed at once (default: {BATCH_MAX_CONCURRENT})')
+    parser.add_argument('--pipeline', action='store_true',
+                       help='With --batch: stage pipeline (download next / transcribe / upload previous)')
     parser.add_argument('--no-timestamps', action='store_true', 
                        help='Remove timestamps from output')
     parser.add_argument('--no-nextcloud', action='store_true',
@@ -298,19 +557,24 @@ def main():
     
     args = parser.parse_args()
     
+    if args.batch:
+        sys.exit(0 if run_batch(args) else 1)
+    if not (args.meeting_url and args.meeting_title):
+        parser.error("meeting_url and meeting_title are required unless --batch is given")
+    
     logger.info("=== Single Meeting Processor ===")
     
     # Process meeting
     include_timestamps = not args.no_timestamps
     save_to_nextcloud = not args.no_nextcloud
     
-    result = process_meeting_from_url(
+    result = asyncio.run(process_meeting_from_url(
         args.meeting_url,
         args.meeting_title,
         args.output,
         include_timestamps,
         save_to_nextcloud
-    )
+    ))
     
     if result:
         print("\n" + "="*60)
@@ -16,11 +16,15 @@ load_dotenv()
 
 from config import *
 from modules.video_processor import download_video, extract_audio_from_video
-from modules.transcription import transcribe_with_whisperx
+from modules.transcription import transcribe_with_whisperx, TRANSCRIPTION_FAILED_MESSAGE
 from modules.speaker_id import identify_speakers_in_transcript, get_committee_members_for_meeting
 from modules.nextcloud import save_transcript_to_nextcloud
 from modules.notifications import send_notification
 from modules.utils import write_processed_entry
+from modules.url_cache import (
+    get_cached_media, store_cached_media, audio_sha256,
+    get_cached_transcript, store_cached_transcript
+)
 from modules.proxy_manager import ProxyManager
 
 # Configure logging
@@ -35,6 +39,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Collapses runs of whitespace in meeting titles
+_WHITESPACE_RE = re.compile(r'\s+')
+
 # Create download directory if it doesn't exist
 Path(DOWNLOAD_DIR).mkdir(exist_ok=True)
 
@@ -107,23 +114,41 @@ def process_single_video(video_url, meeting_title, proxy_manager):
             logger.error("No video URL provided")
             return None
         
-        # Download video
-        logger.info("Starting video download...")
-        video_path = download_video(entry['link'], proxy_manager=proxy_manager)
-        if not video_path:
-            logger.error("Failed to download video")
-            return None
-        
-        # Extract audio
-        logger.info("Extracting audio from video...")
-        audio_path = extract_audio_from_video(video_path)
-        if not audio_path:
-            logger.error("Failed to extract audio")
-            return None
+        cached = get_cached_media(entry['link'])
+        if cached:
+            # Same URL already downloaded and decoded, skip straight to transcription
+            video_path = cached['video_path']
+            audio_path = cached['audio_path']
+            audio_sha = cached['audio_sha'] or audio_sha256(audio_path)
+            logger.info(f"Reusing cached media: {video_path}, {audio_path}")
+        else:
+            # Download video
+            logger.info("Starting video download...")
+            video_path = download_video(entry['link'], proxy_manager=proxy_manager)
+            if not video_path:
+                logger.error("Failed to download video")
+                return None
+            
+            # Extract audio
+            logger.info("Extracting audio from video...")
+            audio_path = extract_audio_from_video(video_path)
+            if not audio_path:
+                logger.error("Failed to extract audio")
+                return None
+            audio_sha = audio_sha256(audio_path)
+            store_cached_media(entry['link'], video_path, audio_path, audio_sha)
         
-        # Transcribe with WhisperX (using optimized settings)
-        logger.info("Starting transcription with WhisperX (optimized mode)...")
-        transcript_data = transcribe_with_whisperx(audio_path, model_size="base")
+        # Reuse the transcript if this exact audio was transcribed before
+        transcript_settings = {'model_size': 'base'}
+        transcript_data = get_cached_transcript(audio_sha, transcript_settings)
+        if transcript_data:
+            logger.info(f"Using cached transcript for audio {audio_sha[:12]}")
+        else:
+            # Transcribe with WhisperX (using optimized settings)
+            logger.info("Starting transcription with WhisperX (optimized mode)...")
+            transcript_data = transcribe_with_whisperx(audio_path, model_size="base")
+            if transcript_data and transcript_data != TRANSCRIPTION_FAILED_MESSAGE:
+                store_cached_transcript(audio_sha, transcript_settings, transcript_data)
         if not transcript_data:
             logger.error("Failed to transcribe audio")
             return None
@@ -140,7 +165,7 @@ def process_single_video(video_url, meeting_title, proxy_manager):
         
         # Clean title for use in filename and document
         title_text = entry['text']
-        clean_title = re.sub(r'\s+', ' ', title_text).strip()
+        clean_title = _WHITESPACE_RE.sub(' ', title_text).strip()
         
         # Save to Nextcloud
         logger.info("Saving transcript to Nextcloud...")
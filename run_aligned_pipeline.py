@@ -7,50 +7,142 @@ Uses Parakeet token timestamps to accurately assign speakers.
 import os
 import json
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 load_dotenv()
 
 import onnx_asr
+import onnxruntime as ort
 import soundfile as sf
 import numpy as np
 
-def get_speaker_at_time(timestamp, diarization_segments):
-    """Find which speaker is talking at a given timestamp."""
-    for seg in diarization_segments:
-        if seg["start"] <= timestamp <= seg["end"]:
-            return seg["speaker"]
-    return "UNKNOWN"
+from modules.formatting import write_json
+
+# Number of in-memory chunks handed to a single model.recognize() call
+CHUNK_BATCH_SIZE = 8
+# Batches in flight at once; onnxruntime releases the GIL during inference,
+# kept small so concurrent batches fit in accelerator memory
+TRANSCRIBE_WORKERS = 2
+
+# Where execution providers that compile the graph persist their compiled
+# engines/blobs, so later runs skip the compile step. Point at a shared,
+# persistent mount to reuse it across machines.
+ORT_CACHE_DIR = os.getenv("ORT_CACHE_DIR", ".ort_cache")
+
+def get_providers():
+    """
+    Available ONNX Runtime providers in ORT's preference order, with the
+    compiled-model cache enabled for providers that support one.
+    """
+    cache_options = {
+        "TensorrtExecutionProvider": {
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": ORT_CACHE_DIR,
+        },
+        "OpenVINOExecutionProvider": {"cache_dir": ORT_CACHE_DIR},
+    }
+    providers = []
+    for name in ort.get_available_providers():
+        if name in cache_options:
+            os.makedirs(ORT_CACHE_DIR, exist_ok=True)
+            providers.append((name, cache_options[name]))
+        else:
+            providers.append(name)
+    return providers
+
+def build_speaker_index(diarization_segments):
+    """
+    Sort diarization segments into arrays for binary-search speaker lookup.
+
+    Returns (starts, reach, speakers), where reach[i] is the furthest end time
+    of segments 0..i. reach is non-decreasing, so the first segment still
+    running at a timestamp can be found with a single searchsorted.
+    """
+    ordered = sorted(diarization_segments, key=lambda s: s["start"])
+    n = len(ordered)
+    starts = np.fromiter((s["start"] for s in ordered), dtype=np.float64, count=n)
+    ends = np.fromiter((s["end"] for s in ordered), dtype=np.float64, count=n)
+    speakers = [s["speaker"] for s in ordered]
+    reach = np.maximum.accumulate(ends) if n else ends
+    return starts, reach, speakers
+
+def get_speakers_at_times(timestamps, speaker_index):
+    """Find which speaker is talking at each of the given timestamps."""
+    starts, reach, speakers = speaker_index
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    n = len(starts)
+
+    # First segment whose end reaches the timestamp; it covers it if it has started
+    idx = np.searchsorted(reach, timestamps, side="left")
+    clipped = np.minimum(idx, n - 1)
+    valid = (idx < n) & (starts[clipped] <= timestamps) if n else np.zeros(len(timestamps), dtype=bool)
+    return [speakers[i] if v else "UNKNOWN" for i, v in zip(clipped.tolist(), valid.tolist())]
 
 def tokens_to_words(tokens, timestamps):
-    """Convert sub-word tokens to words with timestamps."""
+    """
+    Convert sub-word tokens to words with timestamps.
+
+    Returns parallel (starts, ends, words): two float64 arrays and a list of
+    word strings.
+    """
+    starts = []
+    ends = []
     words = []
-    current_word = ""
+    current_word_parts = []
     word_start = None
     
     for token, ts in zip(tokens, timestamps):
-        if token.startswith(" ") or not current_word:
+        if token.startswith(" ") or not current_word_parts:
             # New word starts
-            if current_word:
-                words.append({
-                    "word": current_word.strip(),
-                    "start": word_start,
-                    "end": ts
-                })
-            current_word = token
+            if current_word_parts:
+                words.append("".join(current_word_parts).strip())
+                starts.append(word_start)
+                ends.append(ts)
+            current_word_parts = [token] if token else []
             word_start = ts
         else:
             # Continue current word
-            current_word += token
+            current_word_parts.append(token)
     
     # Don't forget last word
-    if current_word:
-        words.append({
-            "word": current_word.strip(),
-            "start": word_start,
-            "end": timestamps[-1] if timestamps else word_start
-        })
+    if current_word_parts:
+        words.append("".join(current_word_parts).strip())
+        starts.append(word_start)
+        ends.append(timestamps[-1] if timestamps else word_start)
     
-    return words
+    return np.array(starts, dtype=np.float64), np.array(ends, dtype=np.float64), words
+
+def iter_chunk_batches(audio_path, chunk_size, sr):
+    """
+    Stream the audio in chunk-sized float32 blocks, grouped into batches.
+
+    Yields (chunks, offsets) lists of up to CHUNK_BATCH_SIZE, where offsets
+    are the chunk start times in seconds. Chunks under a second are skipped.
+    """
+    batch, offsets = [], []
+    for idx, chunk in enumerate(sf.blocks(audio_path, blocksize=chunk_size, dtype="float32")):
+        if len(chunk) < sr:  # Skip very short chunks
+            continue
+        batch.append(chunk)
+        offsets.append(idx * chunk_size / sr)
+        if len(batch) == CHUNK_BATCH_SIZE:
+            yield batch, offsets
+            batch, offsets = [], []
+    if batch:
+        yield batch, offsets
+
+def transcribe_batch(model, chunks, offsets, sr):
+    """Transcribe a batch of chunks and return (starts, ends, words) on the global timeline."""
+    starts, ends, words = [], [], []
+    for offset, result in zip(offsets, model.recognize(chunks, sample_rate=sr)):
+        chunk_starts, chunk_ends, chunk_words = tokens_to_words(result.tokens, result.timestamps)
+        
+        # Add offset to timestamps
+        starts.append(chunk_starts + offset)
+        ends.append(chunk_ends + offset)
+        words.extend(chunk_words)
+    return starts, ends, words
 
 def main():
     audio_path = "downloads/house_chamber_78143.wav"
@@ -65,11 +157,16 @@ def main():
     with open(diarization_path) as f:
         diar_data = json.load(f)
     diar_segments = diar_data["segments"]
+    speaker_index = build_speaker_index(diar_segments)
     print(f"      {len(diar_segments)} segments loaded")
     
     # Load Parakeet with timestamps
     print("\n[2/4] Loading Parakeet model...")
-    model = onnx_asr.load_model("nemo-parakeet-tdt-0.6b-v2").with_timestamps()
+    model = onnx_asr.load_model("nemo-parakeet-tdt-0.6b-v2", providers=get_providers()).with_timestamps()
+    
+    # Run one second of silence through the model so session initialisation and
+    # kernel selection happen here, not inside the first (timed) chunk batch
+    model.recognize(np.zeros(16000, dtype=np.float32), sample_rate=16000)
     
     # Transcribe with timestamps
     print("\n[3/4] Transcribing with timestamps...")
@@ -81,65 +178,65 @@ def main():
     
     # For long audio, process in chunks but track offset
     chunk_duration = 60  # seconds
-    audio_data, sr = sf.read(audio_path)
-    
-    all_words = []
+    sr = info.samplerate
     chunk_size = chunk_duration * sr
+    total_batches = -(-info.frames // (chunk_size * CHUNK_BATCH_SIZE))
     
-    start_time = time.time()
-    for i in range(0, len(audio_data), chunk_size):
-        chunk = audio_data[i:i + chunk_size]
-        if len(chunk) < sr:  # Skip very short chunks
-            continue
-            
-        offset = i / sr
-        chunk_path = f"/tmp/chunk_{i}.wav"
-        sf.write(chunk_path, chunk, sr)
-        
-        try:
-            result = model.recognize(chunk_path)
-            words = tokens_to_words(result.tokens, result.timestamps)
-            
-            # Add offset to timestamps
-            for w in words:
-                w["start"] += offset
-                w["end"] += offset
-                all_words.append(w)
-        finally:
-            os.remove(chunk_path)
+    start_parts, end_parts, word_strings = [], [], []
+    
+    def collect(future, done):
+        starts, ends, words = future.result()
+        start_parts.extend(starts)
+        end_parts.extend(ends)
+        word_strings.extend(words)
         
         # Progress
-        progress = min(100, (i + chunk_size) / len(audio_data) * 100)
+        progress = min(100, done / max(total_batches, 1) * 100)
         print(f"      Progress: {progress:.0f}%", end="\r")
     
+    start_time = time.time()
+    done = 0
+    # Chunks are read block by block, so only the batches in flight are held in
+    # memory; futures are collected in submission order to keep words sorted
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS) as executor:
+        for chunks, offsets in iter_chunk_batches(audio_path, chunk_size, sr):
+            pending.append(executor.submit(transcribe_batch, model, chunks, offsets, sr))
+            if len(pending) > TRANSCRIBE_WORKERS:
+                done += 1
+                collect(pending.popleft(), done)
+        while pending:
+            done += 1
+            collect(pending.popleft(), done)
+    
+    word_starts = np.concatenate(start_parts) if start_parts else np.empty(0)
+    word_ends = np.concatenate(end_parts) if end_parts else np.empty(0)
+    
     transcribe_time = time.time() - start_time
-    print(f"\n      Transcribed {len(all_words)} words in {transcribe_time:.1f}s")
+    print(f"\n      Transcribed {len(word_strings)} words in {transcribe_time:.1f}s")
     
     # Assign speakers to words
     print("\n[4/4] Assigning speakers to words...")
-    for word in all_words:
-        word["speaker"] = get_speaker_at_time(word["start"], diar_segments)
-    
-    # Group consecutive same-speaker words into segments
-    segments = []
-    current_seg = None
-    
-    for word in all_words:
-        if current_seg is None or current_seg["speaker"] != word["speaker"]:
-            if current_seg:
-                segments.append(current_seg)
-            current_seg = {
-                "speaker": word["speaker"],
-                "start": word["start"],
-                "end": word["end"],
-                "text": word["word"]
-            }
-        else:
-            current_seg["end"] = word["end"]
-            current_seg["text"] += " " + word["word"]
+    word_speakers = get_speakers_at_times(word_starts, speaker_index)
     
-    if current_seg:
-        segments.append(current_seg)
+    # Group consecutive same-speaker words into segments at speaker-change boundaries
+    speakers_arr = np.array(word_speakers, dtype=object)
+    boundaries = np.concatenate((
+        [0],
+        np.flatnonzero(speakers_arr[1:] != speakers_arr[:-1]) + 1,
+        [len(speakers_arr)],
+    )).tolist() if len(speakers_arr) else [0]
+    seg_starts = word_starts.tolist()
+    seg_ends = word_ends.tolist()
+    segments = [
+        {
+            "speaker": word_speakers[b],
+            "start": seg_starts[b],
+            "end": seg_ends[e - 1],
+            "text": " ".join(word_strings[b:e])
+        }
+        for b, e in zip(boundaries[:-1], boundaries[1:])
+    ]
     
     print(f"      Created {len(segments)} speaker segments")
     
@@ -161,15 +258,14 @@ def main():
     
     # Save
     output_path = "output/house_chamber_78143_aligned.json"
-    with open(output_path, "w") as f:
-        json.dump({
-            "meeting_id": "78143",
-            "audio_duration": duration,
-            "num_words": len(all_words),
-            "num_segments": len(segments),
-            "transcription_time": transcribe_time,
-            "segments": segments
-        }, f, indent=2)
+    write_json(output_path, {
+        "meeting_id": "78143",
+        "audio_duration": duration,
+        "num_words": len(word_strings),
+        "num_segments": len(segments),
+        "transcription_time": transcribe_time,
+        "segments": segments
+    })
     print(f"\nSaved to: {output_path}")
     
     # Save text version
@@ -6,68 +6,279 @@ Uses nearest-speaker matching to handle gaps in diarization.
 
 import os
 import json
+import math
+import bisect
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 load_dotenv()
 
 import onnx_asr
+import onnxruntime as ort
 import soundfile as sf
+import numpy as np
 
-def get_speaker_at_time(timestamp, diarization_segments):
-    """Find speaker at timestamp, or nearest speaker if in a gap."""
-    # First, try exact match
-    for seg in diarization_segments:
-        if seg["start"] <= timestamp <= seg["end"]:
-            return seg["speaker"]
-    
-    # No exact match - find nearest segment
-    min_dist = float("inf")
-    nearest_speaker = None
-    
-    for seg in diarization_segments:
-        # Distance to segment start or end
-        dist_start = abs(timestamp - seg["start"])
-        dist_end = abs(timestamp - seg["end"])
-        dist = min(dist_start, dist_end)
-        
-        if dist < min_dist:
-            min_dist = dist
-            nearest_speaker = seg["speaker"]
+from modules.formatting import format_mmss, speaker_runs, write_json
+
+PARAKEET_MODEL = "nemo-parakeet-tdt-0.6b-v2"
+
+# Audio is split into equal chunks of at most 40 s, overlap included (so long
+# meetings get ~30-40 s chunks and no short tail), overlapping by 1 s so words on a
+# boundary are heard whole by at least one chunk
+MAX_CHUNK_SECONDS = 40
+CHUNK_OVERLAP_SECONDS = 1.0
+# Chunks handed to a single model.recognize() call
+CHUNK_BATCH_SIZE = 8
+# CPU-only runs spread chunks over this many processes, each with its own
+# INT8 session pinned to a slice of the cores (1 = transcribe in-process)
+CPU_WORKERS = int(os.getenv("PARAKEET_CPU_WORKERS", "2"))
+# Exported before workers start so their OpenMP/BLAS pools stay single-threaded
+WORKER_THREAD_ENV = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMBA_NUM_THREADS")
+
+# Words in a diarization gap take the nearest speaker within this many seconds
+MAX_GAP_SECONDS = 2.0
+
+def build_speaker_index(diarization_segments):
+    """
+    Sort diarization segments into arrays for binary-search speaker lookup.
+
+    Returns (starts, reach, reach_idx, speakers), where reach[i] is the
+    furthest end time of segments 0..i and reach_idx[i] the first segment
+    reaching it. reach is non-decreasing, so both the segment covering a
+    timestamp and the last segment ending before a gap are one searchsorted
+    away.
+    """
+    n = len(diarization_segments)
+    starts = np.fromiter((s["start"] for s in diarization_segments), dtype=np.float64, count=n)
+    ends = np.fromiter((s["end"] for s in diarization_segments), dtype=np.float64, count=n)
+    speakers = np.array([s["speaker"] for s in diarization_segments], dtype=str)
+    order = np.argsort(starts, kind="stable")
+    starts, ends, speakers = starts[order], ends[order], speakers[order]
+    if not n:
+        return starts, ends, np.arange(0), speakers
+    reach = np.maximum.accumulate(ends)
+    new_max = np.concatenate(([True], ends[1:] > reach[:-1]))
+    reach_idx = np.maximum.accumulate(np.where(new_max, np.arange(n), 0))
+    return starts, reach, reach_idx, speakers
+
+def get_speakers_at_times(timestamps, speaker_index):
+    """
+    Find the speaker at each timestamp, or nearest speaker if in a gap.
+
+    Returns (labels, assigned): a list of speaker labels ("UNKNOWN" where no
+    segment is close enough) and the boolean mask of timestamps that got one.
+    """
+    starts, reach, reach_idx, speakers = speaker_index
+    n = len(starts)
+    if not n:
+        return ["UNKNOWN"] * len(timestamps), np.zeros(len(timestamps), dtype=bool)
     
-    # Only use nearest if within 2 seconds
-    if min_dist <= 2.0 and nearest_speaker:
-        return nearest_speaker
+    # First, try exact match: the first segment whose end reaches the timestamp
+    idx = np.searchsorted(reach, timestamps, side="left")
+    hit = np.minimum(idx, n - 1)
+    covered = (idx < n) & (starts[hit] <= timestamps)
+    
+    # In a gap - nearest is either the latest end before it or the next start
+    prev = np.searchsorted(starts, timestamps, side="right") - 1
+    nxt = np.minimum(prev + 1, n - 1)
+    prev_dist = np.where(prev >= 0, timestamps - reach[np.maximum(prev, 0)], np.inf)
+    next_dist = np.where(prev + 1 < n, starts[nxt] - timestamps, np.inf)
+    use_next = next_dist < prev_dist
+    nearest = np.where(use_next, nxt, reach_idx[np.maximum(prev, 0)])
+    min_dist = np.where(use_next, next_dist, prev_dist)
     
-    return "UNKNOWN"
+    # Only use nearest if within 2 seconds
+    seg_idx = np.where(covered, hit, np.where(min_dist <= MAX_GAP_SECONDS, nearest, -1))
+    assigned = seg_idx >= 0
+    return np.where(assigned, speakers[seg_idx], "UNKNOWN").tolist(), assigned
 
 def tokens_to_words(tokens, timestamps):
-    """Convert sub-word tokens to words with timestamps."""
-    words = []
-    current_word = ""
-    word_start = None
-    
-    for token, ts in zip(tokens, timestamps):
-        if token.startswith(" ") or not current_word:
-            if current_word.strip():
-                words.append({
-                    "word": current_word.strip(),
-                    "start": word_start,
-                    "end": ts
-                })
-            current_word = token
-            word_start = ts
-        else:
-            current_word += token
+    """
+    Convert sub-word tokens to words with timestamps.
+
+    A word starts at every token with a leading space (and at the first
+    non-empty token); each word ends where the next one starts.
+    """
+    tokens = list(tokens)
+    n = min(len(tokens), len(timestamps))
+    if not n:
+        return []
+    tokens = tokens[:n]
+    
+    # Leading empty tokens each open (and immediately drop) their own word
+    leading_empty = next((i for i, t in enumerate(tokens) if t), n)
+    is_word_start = np.fromiter((t.startswith(" ") for t in tokens), dtype=bool, count=n)
+    is_word_start[:leading_empty + 1] = True
+    bounds = np.flatnonzero(is_word_start).tolist() + [n]
     
-    if current_word.strip():
-        words.append({
-            "word": current_word.strip(),
-            "start": word_start,
-            "end": timestamps[-1] if timestamps else word_start
-        })
+    words = []
+    for a, b in zip(bounds, bounds[1:]):
+        word = "".join(tokens[a:b]).strip()
+        if word:
+            words.append({
+                "word": word,
+                "start": timestamps[a],
+                "end": timestamps[b] if b < n else timestamps[-1]
+            })
     
     return words
 
+def load_parakeet():
+    """
+    Load Parakeet with timestamps on CUDA when available, otherwise the INT8
+    quantized weights on CPU.
+    """
+    if "CUDAExecutionProvider" in ort.get_available_providers():
+        # Quantized MatMulInteger ops are CPU kernels, so keep FP32 on GPU and
+        # let cuDNN benchmark its convolution algorithms once per session
+        providers = [
+            ("CUDAExecutionProvider", {"cudnn_conv_algo_search": "EXHAUSTIVE"}),
+            "CPUExecutionProvider",
+        ]
+        quantization = None
+    else:
+        providers = ["CPUExecutionProvider"]
+        quantization = "int8"
+    print(f"      Device: {'cuda' if quantization is None else 'cpu'}, quantization: {quantization or 'none'}")
+    return onnx_asr.load_model(
+        PARAKEET_MODEL, quantization=quantization, providers=providers
+    ).with_timestamps()
+
+# Per-process state for CPU pool workers, set up by _init_worker
+_worker_model = None
+_worker_audio = None
+
+def _core_sets(num_workers):
+    """Split the CPUs this process may use into one slice per worker."""
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    per_worker = max(1, len(cores) // num_workers)
+    return [cores[r * per_worker:(r + 1) * per_worker] or cores for r in range(num_workers)]
+
+def _init_worker(core_sets, audio_path):
+    """Pool initializer: pin this worker to its cores and load one CPU session."""
+    global _worker_model, _worker_audio
+    cores = core_sets.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = len(cores)
+    _worker_model = onnx_asr.load_model(
+        PARAKEET_MODEL, quantization="int8", providers=["CPUExecutionProvider"],
+        sess_options=sess_options,
+    ).with_timestamps()
+    _worker_audio = sf.SoundFile(audio_path)
+
+def _transcribe_chunk(bounds):
+    """Transcribe one (start, end) chunk inside a pool worker."""
+    start, end = bounds
+    result = _worker_model.recognize(
+        read_chunk(_worker_audio, start, end), sample_rate=_worker_audio.samplerate
+    )
+    return list(result.tokens), list(result.timestamps)
+
+def iter_chunks_in_pool(audio_path, chunk_bounds, num_workers):
+    """
+    Transcribe chunks across CPU worker processes.
+
+    Workers read their own chunks from the WAV, so only (start, end) pairs
+    and token lists cross the process boundary. Yields (tokens, timestamps)
+    per chunk in order.
+    """
+    os.environ.update({var: "1" for var in WORKER_THREAD_ENV})
+    ctx = multiprocessing.get_context("spawn")
+    core_queue = ctx.Queue()
+    for cores in _core_sets(num_workers):
+        core_queue.put(cores)
+    with ProcessPoolExecutor(
+        max_workers=num_workers, mp_context=ctx,
+        initializer=_init_worker, initargs=(core_queue, audio_path),
+    ) as executor:
+        yield from executor.map(_transcribe_chunk, chunk_bounds)
+
+def iter_chunks_in_process(model, audio_file, chunk_bounds):
+    """Transcribe chunks with one model, CHUNK_BATCH_SIZE per recognize() call."""
+    for b in range(0, len(chunk_bounds), CHUNK_BATCH_SIZE):
+        batch_bounds = chunk_bounds[b:b + CHUNK_BATCH_SIZE]
+        chunks = [read_chunk(audio_file, start, end) for start, end in batch_bounds]
+        for result in model.recognize(chunks, sample_rate=audio_file.samplerate):
+            yield list(result.tokens), list(result.timestamps)
+
+def plan_chunks(duration):
+    """
+    Split the audio into evenly sized chunks of at most MAX_CHUNK_SECONDS,
+    overlap included.
+
+    Returns a list of (start, end) times in seconds; each chunk runs
+    CHUNK_OVERLAP_SECONDS past the start of the next one.
+    """
+    if duration <= MAX_CHUNK_SECONDS:
+        return [(0.0, duration)]
+    # Consecutive chunks share the overlap, so they advance by less than
+    # their length; fractional so there is no sliver of a last chunk
+    num_chunks = math.ceil((duration - CHUNK_OVERLAP_SECONDS) / (MAX_CHUNK_SECONDS - CHUNK_OVERLAP_SECONDS))
+    stride = (duration - CHUNK_OVERLAP_SECONDS) / num_chunks
+    return [
+        (k * stride, min(duration, (k + 1) * stride + CHUNK_OVERLAP_SECONDS))
+        for k in range(num_chunks)
+    ]
+
+def read_chunk(audio_file, start, end):
+    """Read the [start, end) second range of an open SoundFile as float32."""
+    sr = audio_file.samplerate
+    first = int(start * sr)
+    audio_file.seek(first)
+    return audio_file.read(int(end * sr) - first, dtype="float32")
+
+def _lcs_pairs(a, b):
+    """Index pairs (i, j) of a longest common subsequence of token lists a and b."""
+    lengths = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) - 1, -1, -1):
+        for j in range(len(b) - 1, -1, -1):
+            if a[i] == b[j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+
+    pairs = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            pairs.append((i, j))
+            i += 1
+            j += 1
+        elif lengths[i + 1][j] >= lengths[i][j + 1]:
+            i += 1
+        else:
+            j += 1
+    return pairs
+
+def lcs_merge(prev_tokens, prev_ts, next_tokens, next_ts, overlap_start, overlap_end):
+    """
+    Find where to stitch two token streams (absolute, sorted timestamps)
+    whose audio overlaps in [overlap_start, overlap_end].
+
+    Tokens heard by both chunks are aligned with a longest common
+    subsequence and the streams are joined at the middle matched token, so
+    boundary words are neither duplicated nor dropped. Without any match the
+    streams are cut at the middle of the overlap.
+
+    Returns (cut_prev, cut_next): keep prev[:cut_prev] followed by next[cut_next:].
+    """
+    p0 = bisect.bisect_left(prev_ts, overlap_start)
+    n1 = bisect.bisect_left(next_ts, overlap_end)
+
+    pairs = _lcs_pairs(prev_tokens[p0:], next_tokens[:n1])
+    if pairs:
+        i, j = pairs[len(pairs) // 2]
+        return p0 + i, j
+
+    midpoint = (overlap_start + overlap_end) / 2
+    return max(p0, bisect.bisect_left(prev_ts, midpoint)), bisect.bisect_left(next_ts, midpoint)
+
 def main():
     audio_path = "downloads/house_chamber_78143.wav"
     diarization_path = "output/house_chamber_78143_diarization.json"
@@ -81,78 +292,84 @@ def main():
     with open(diarization_path) as f:
         diar_data = json.load(f)
     diar_segments = diar_data["segments"]
+    speaker_index = build_speaker_index(diar_segments)
     print(f"      {len(diar_segments)} segments loaded")
     
     # Load Parakeet
     print("\n[2/4] Loading Parakeet model...")
-    model = onnx_asr.load_model("nemo-parakeet-tdt-0.6b-v2").with_timestamps()
+    use_pool = CPU_WORKERS > 1 and "CUDAExecutionProvider" not in ort.get_available_providers()
+    if use_pool:
+        # Each worker process loads its own session
+        print(f"      Device: cpu, quantization: int8, {CPU_WORKERS} worker processes")
+        model = None
+    else:
+        model = load_parakeet()
     
     # Transcribe
     print("\n[3/4] Transcribing with timestamps...")
-    info = sf.info(audio_path)
-    duration = info.duration
+    # Stream the WAV: only the current batch of chunks is decoded (straight
+    # to float32, the model's input type) instead of the whole recording
+    audio_file = sf.SoundFile(audio_path)
+    sr = audio_file.samplerate
+    duration = audio_file.frames / sr
     print(f"      Audio duration: {duration/60:.1f} minutes")
     
-    audio_data, sr = sf.read(audio_path)
-    chunk_duration = 60
-    chunk_size = chunk_duration * sr
+    chunk_bounds = plan_chunks(duration)
+    print(f"      {len(chunk_bounds)} chunks of ~{chunk_bounds[0][1] - chunk_bounds[0][0]:.0f}s")
     
-    all_words = []
+    all_tokens, all_timestamps = [], []
+    prev_end = None
     start_time = time.time()
     
-    for i in range(0, len(audio_data), chunk_size):
-        chunk = audio_data[i:i + chunk_size]
-        if len(chunk) < sr:
-            continue
-            
-        offset = i / sr
-        chunk_path = f"/tmp/chunk_{i}.wav"
-        sf.write(chunk_path, chunk, sr)
-        
-        try:
-            result = model.recognize(chunk_path)
-            words = tokens_to_words(result.tokens, result.timestamps)
-            for w in words:
-                w["start"] += offset
-                w["end"] += offset
-                all_words.append(w)
-        finally:
-            os.remove(chunk_path)
+    if use_pool:
+        chunk_results = iter_chunks_in_pool(audio_path, chunk_bounds, CPU_WORKERS)
+    else:
+        chunk_results = iter_chunks_in_process(model, audio_file, chunk_bounds)
+    
+    for i, ((start, end), (tokens, timestamps)) in enumerate(zip(chunk_bounds, chunk_results)):
+        timestamps = [ts + start for ts in timestamps]
+        cut_next = 0
+        if prev_end is not None:
+            # Drop the duplicated overlap before appending this chunk
+            cut_prev, cut_next = lcs_merge(
+                all_tokens, all_timestamps, tokens, timestamps, start, prev_end
+            )
+            del all_tokens[cut_prev:]
+            del all_timestamps[cut_prev:]
+        all_tokens.extend(tokens[cut_next:])
+        all_timestamps.extend(timestamps[cut_next:])
+        prev_end = end
         
-        progress = min(100, (i + chunk_size) / len(audio_data) * 100)
+        progress = (i + 1) / len(chunk_bounds) * 100
         print(f"      Progress: {progress:.0f}%", end="\r")
     
+    audio_file.close()
+    all_words = tokens_to_words(all_tokens, all_timestamps)
+    
     transcribe_time = time.time() - start_time
     print(f"\n      Transcribed {len(all_words)} words in {transcribe_time:.1f}s")
     
     # Assign speakers
     print("\n[4/4] Assigning speakers (with gap handling)...")
-    for word in all_words:
-        word["speaker"] = get_speaker_at_time(word["start"], diar_segments)
-    
-    unknown_count = sum(1 for w in all_words if w["speaker"] == "UNKNOWN")
-    print(f"      UNKNOWN words: {unknown_count} ({100*unknown_count/len(all_words):.1f}%)")
-    
-    # Group into segments
-    segments = []
-    current_seg = None
-    
-    for word in all_words:
-        if current_seg is None or current_seg["speaker"] != word["speaker"]:
-            if current_seg:
-                segments.append(current_seg)
-            current_seg = {
-                "speaker": word["speaker"],
-                "start": word["start"],
-                "end": word["end"],
-                "text": word["word"]
-            }
-        else:
-            current_seg["end"] = word["end"]
-            current_seg["text"] += " " + word["word"]
+    num_words = len(all_words)
+    word_times = np.fromiter((w["start"] for w in all_words), dtype=np.float64, count=num_words)
+    word_speakers, assigned = get_speakers_at_times(word_times, speaker_index)
+    for word, speaker in zip(all_words, word_speakers):
+        word["speaker"] = speaker
+    
+    unknown_count = num_words - int(np.count_nonzero(assigned))
+    print(f"      UNKNOWN words: {unknown_count} ({100*unknown_count/num_words:.1f}%)")
     
-    if current_seg:
-        segments.append(current_seg)
+    # Group runs of same-speaker words into segments
+    segments = [
+        {
+            "speaker": all_words[a]["speaker"],
+            "start": all_words[a]["start"],
+            "end": all_words[b - 1]["end"],
+            "text": " ".join(w["word"] for w in all_words[a:b])
+        }
+        for a, b in speaker_runs([w["speaker"] for w in all_words])
+    ]
     
     # Filter out UNKNOWN segments that are very short
     segments = [s for s in segments if s["speaker"] != "UNKNOWN" or len(s["text"].split()) > 3]
@@ -164,9 +381,9 @@ def main():
     print("TRANSCRIPT WITH SPEAKER LABELS")
     print("="*60)
     
-    for i, seg in enumerate(segments[:25]):
-        start_fmt = f"{int(seg['start']//60):02d}:{int(seg['start']%60):02d}"
-        end_fmt = f"{int(seg['end']//60):02d}:{int(seg['end']%60):02d}"
+    start_fmts = format_mmss([seg["start"] for seg in segments])
+    end_fmts = format_mmss([seg["end"] for seg in segments[:25]])
+    for seg, start_fmt, end_fmt in zip(segments[:25], start_fmts, end_fmts):
         text = seg["text"][:200] + "..." if len(seg["text"]) > 200 else seg["text"]
         print(f"\n[{start_fmt}-{end_fmt}] {seg['speaker']}:")
         print(f"  {text}")
@@ -176,17 +393,17 @@ def main():
     
     # Save
     output_path = "output/house_chamber_78143_aligned_v2.json"
-    with open(output_path, "w") as f:
-        json.dump({"segments": segments}, f, indent=2)
+    write_json(output_path, {"segments": segments})
     print(f"\nSaved to: {output_path}")
     
     txt_path = "output/house_chamber_78143_aligned_v2.txt"
+    lines = ["House Chamber Meeting - January 26, 2026\n", "="*50 + "\n\n"]
+    lines.extend(
+        f"[{start_fmt}] {seg['speaker']}:\n{seg['text']}\n\n"
+        for seg, start_fmt in zip(segments, start_fmts)
+    )
     with open(txt_path, "w") as f:
-        f.write("House Chamber Meeting - January 26, 2026\n")
-        f.write("="*50 + "\n\n")
-        for seg in segments:
-            start_fmt = f"{int(seg['start']//60):02d}:{int(seg['start']%60):02d}"
-            f.write(f"[{start_fmt}] {seg['speaker']}:\n{seg['text']}\n\n")
+        f.write("".join(lines))
     print(f"Saved to: {txt_path}")
 
 if __name__ == "__main__":
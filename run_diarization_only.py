@@ -3,6 +3,7 @@
 
 import sys
 import json
+import torch
 from modules.pyannote_diarization import PyannoteDiarizer
 
 def main():
@@ -13,10 +14,12 @@ def main():
     audio_file = sys.argv[1]
     output_file = sys.argv[2]
     
-    print(f"Running diarization on: {audio_file}")
-    print("This may take 10-20 minutes...")
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    print(f"Running diarization on: {audio_file} ({device})")
+    if device == "cpu":
+        print("This may take 10-20 minutes...")
     
-    diarizer = PyannoteDiarizer(device="cpu", max_speakers=25)
+    diarizer = PyannoteDiarizer(device=device, max_speakers=25)
     segments = diarizer.diarize(audio_file)
     
     output_data = {'segments': segments}
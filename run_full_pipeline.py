@@ -8,6 +8,10 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+from modules.formatting import format_mmss, speaker_runs, write_json
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -19,6 +23,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def diarization_arrays(diarization_segments):
+    """
+    Convert diarization segments to parallel (starts, ends, speakers) numpy
+    arrays sorted by start time. Built once per file and passed downstream
+    instead of the list of dicts.
+    """
+    n = len(diarization_segments)
+    starts = np.fromiter((seg["start"] for seg in diarization_segments), dtype=np.float64, count=n)
+    ends = np.fromiter((seg["end"] for seg in diarization_segments), dtype=np.float64, count=n)
+    speakers = np.array([seg["speaker"] for seg in diarization_segments], dtype=str)
+    order = np.argsort(starts, kind="stable")
+    return starts[order], ends[order], speakers[order]
+
+def align_proportionally(transcript, starts, ends, speakers):
+    """
+    Simple proportional alignment: give each diarization segment a share of
+    the transcript's words matching its share of the total speaking time.
+    """
+    if not len(starts):
+        return []
+    
+    words = transcript.split()
+    total_words = len(words)
+    durations = ends - starts
+    total_speaking_time = durations.sum()
+    
+    # Proportional word count, at least one word per segment; once the words
+    # run out the remaining segments get empty text
+    word_counts = np.maximum(1, (durations / total_speaking_time * total_words).astype(np.int64))
+    bounds = [0] + np.minimum(np.cumsum(word_counts), total_words).tolist()
+    
+    aligned_segments = [
+        {
+            "speaker": speaker,
+            "start": start,
+            "end": end,
+            "text": " ".join(words[a:b])
+        }
+        for start, end, speaker, a, b in zip(
+            starts.tolist(), ends.tolist(), speakers.tolist(), bounds, bounds[1:]
+        )
+    ]
+    
+    # Remaining words to last segment
+    if bounds[-1] < total_words:
+        aligned_segments[-1]["text"] += " " + " ".join(words[bounds[-1]:])
+    
+    return aligned_segments
+
+def merge_speaker_turns(aligned_segments):
+    """Merge consecutive same-speaker segments."""
+    return [
+        {
+            "speaker": aligned_segments[a]["speaker"],
+            "start": aligned_segments[a]["start"],
+            "end": aligned_segments[b - 1]["end"],
+            "text": " ".join(seg["text"] for seg in aligned_segments[a:b])
+        }
+        for a, b in speaker_runs([seg["speaker"] for seg in aligned_segments])
+    ]
+
 def main():
     audio_path = "downloads/house_chamber_78143.wav"
     diarization_path = "output/house_chamber_78143_diarization.json"
@@ -31,17 +96,32 @@ def main():
     print("\n[1/3] Loading pre-computed Pyannote diarization...")
     with open(diarization_path) as f:
         diar_data = json.load(f)
-    diarization_segments = diar_data["segments"]
-    speakers = set(seg["speaker"] for seg in diarization_segments)
-    print(f"      Loaded {len(diarization_segments)} segments, {len(speakers)} speakers")
+    diar_starts, diar_ends, diar_speakers = diarization_arrays(diar_data["segments"])
+    num_speakers = len(np.unique(diar_speakers))
+    print(f"      Loaded {len(diar_starts)} segments, {num_speakers} speakers")
     
     # Step 2: Transcribe with Parakeet
     print("\n[2/3] Transcribing with Parakeet TDT...")
-    from modules.parakeet_transcription import ParakeetTranscriber
-    
-    transcriber = ParakeetTranscriber(device="cpu", chunk_duration=60)
-    start = time.time()
-    transcript = transcriber.transcribe(audio_path)
+    from modules.model_server import connect
+    
+    # Reuse the model held by a running model server, else load it here
+    model_service = connect()
+    if model_service is not None:
+        print("      Using persistent model server")
+        start = time.time()
+        transcript = model_service.transcribe_parakeet(os.path.abspath(audio_path))
+    else:
+        from modules.parakeet_transcription import ParakeetTranscriber
+        import onnxruntime as ort
+        
+        # GPU when available; on CPU the INT8 weights are several times faster than FP32
+        if "CUDAExecutionProvider" in ort.get_available_providers():
+            transcriber = ParakeetTranscriber(device="cuda", chunk_duration=60)
+        else:
+            transcriber = ParakeetTranscriber(device="cpu", chunk_duration=60, quantization="int8")
+        print(f"      Device: {transcriber.device}, quantization: {transcriber.quantization or 'none'}")
+        start = time.time()
+        transcript = transcriber.transcribe(audio_path)
     transcribe_time = time.time() - start
     print(f"      Transcription complete in {transcribe_time:.1f}s")
     print(f"      Transcript length: {len(transcript)} chars")
@@ -49,40 +129,12 @@ def main():
     # Step 3: Align transcript with diarization
     print("\n[3/3] Aligning transcript with speaker segments...")
     
-    # Get audio duration
-    import librosa
-    y, sr = librosa.load(audio_path, sr=16000, mono=True, duration=1)
+    # Get audio duration from the header alone
     import soundfile as sf
     info = sf.info(audio_path)
     audio_duration = info.duration
     
-    # Simple proportional alignment
-    words = transcript.split()
-    total_words = len(words)
-    total_speaking_time = sum(seg["end"] - seg["start"] for seg in diarization_segments)
-    
-    aligned_segments = []
-    word_idx = 0
-    
-    for seg in diarization_segments:
-        seg_duration = seg["end"] - seg["start"]
-        # Proportional word count
-        seg_word_count = int((seg_duration / total_speaking_time) * total_words)
-        seg_word_count = max(1, min(seg_word_count, total_words - word_idx))
-        
-        seg_words = words[word_idx:word_idx + seg_word_count]
-        aligned_segments.append({
-            "speaker": seg["speaker"],
-            "start": seg["start"],
-            "end": seg["end"],
-            "text": " ".join(seg_words)
-        })
-        word_idx += seg_word_count
-    
-    # Remaining words to last segment
-    if word_idx < total_words and aligned_segments:
-        aligned_segments[-1]["text"] += " " + " ".join(words[word_idx:])
-    
+    aligned_segments = align_proportionally(transcript, diar_starts, diar_ends, diar_speakers)
     print(f"      Aligned {len(aligned_segments)} segments")
     
     # Format output
@@ -90,19 +142,12 @@ def main():
     print("TRANSCRIPT WITH SPEAKER LABELS")
     print("="*60)
     
-    # Merge consecutive same-speaker segments
-    merged = []
-    for seg in aligned_segments:
-        if merged and merged[-1]["speaker"] == seg["speaker"]:
-            merged[-1]["text"] += " " + seg["text"]
-            merged[-1]["end"] = seg["end"]
-        else:
-            merged.append(seg.copy())
+    merged = merge_speaker_turns(aligned_segments)
     
     # Print first 20 merged segments
-    for i, seg in enumerate(merged[:20]):
-        start_fmt = f"{int(seg['start']//60):02d}:{int(seg['start']%60):02d}"
-        end_fmt = f"{int(seg['end']//60):02d}:{int(seg['end']%60):02d}"
+    start_fmts = format_mmss([seg["start"] for seg in merged])
+    end_fmts = format_mmss([seg["end"] for seg in merged[:20]])
+    for seg, start_fmt, end_fmt in zip(merged[:20], start_fmts, end_fmts):
         text_preview = seg["text"][:100] + "..." if len(seg["text"]) > 100 else seg["text"]
         print(f"\n[{start_fmt}-{end_fmt}] {seg['speaker']}:")
         print(f"  {text_preview}")
@@ -112,28 +157,27 @@ def main():
     
     # Save full transcript
     output_path = "output/house_chamber_78143_transcript.json"
-    with open(output_path, "w") as f:
-        json.dump({
-            "meeting_id": "78143",
-            "meeting_title": "House Chamber Meeting",
-            "date": "2026-01-26",
-            "audio_duration": audio_duration,
-            "transcription_time": transcribe_time,
-            "num_speakers": len(speakers),
-            "num_segments": len(merged),
-            "segments": merged
-        }, f, indent=2)
+    write_json(output_path, {
+        "meeting_id": "78143",
+        "meeting_title": "House Chamber Meeting",
+        "date": "2026-01-26",
+        "audio_duration": audio_duration,
+        "transcription_time": transcribe_time,
+        "num_speakers": num_speakers,
+        "num_segments": len(merged),
+        "segments": merged
+    })
     print(f"\nFull transcript saved to: {output_path}")
     
     # Also save text version
     txt_path = "output/house_chamber_78143_transcript.txt"
+    lines = ["House Chamber Meeting - January 26, 2026\n", "="*50 + "\n\n"]
+    lines.extend(
+        f"[{start_fmt}] {seg['speaker']}:\n{seg['text']}\n\n"
+        for seg, start_fmt in zip(merged, start_fmts)
+    )
     with open(txt_path, "w") as f:
-        f.write("House Chamber Meeting - January 26, 2026\n")
-        f.write("="*50 + "\n\n")
-        for seg in merged:
-            start_fmt = f"{int(seg['start']//60):02d}:{int(seg['start']%60):02d}"
-            f.write(f"[{start_fmt}] {seg['speaker']}:\n")
-            f.write(f"{seg['text']}\n\n")
+        f.write("".join(lines))
     print(f"Text transcript saved to: {txt_path}")
     
     print("\n" + "="*60)
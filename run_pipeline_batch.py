@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Run transcription + diarization + alignment over many meetings, overlapping
+the stages across files.
+
+Usage: python3 run_pipeline_batch.py <audio_file> [<audio_file> ...]
+
+With Ray installed, Parakeet and Pyannote each run in a long-lived actor, so
+file N's transcription overlaps its own and later files' diarization, and each
+file is aligned and written as soon as both of its results are in. Without
+Ray the files are processed one after another.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+load_dotenv()
+
+# Optional ray import (stage pipelining across files, falls back to sequential)
+try:
+    import ray
+except ImportError:
+    ray = None
+
+from modules.formatting import format_mmss, write_json
+from run_full_pipeline import (
+    diarization_arrays, align_proportionally, merge_speaker_turns
+)
+
+# Resources reserved by the Ray actors; a fractional GPU leaves room for
+# other GPU work on the same device
+TRANSCRIBE_NUM_GPUS = 0.4
+DIARIZE_NUM_CPUS = 2
+
+class TranscribeStage:
+    """Parakeet transcription, loaded once per process."""
+
+    def __init__(self):
+        import onnxruntime as ort
+        from modules.parakeet_transcription import ParakeetTranscriber
+
+        if "CUDAExecutionProvider" in ort.get_available_providers():
+            self.transcriber = ParakeetTranscriber(device="cuda", chunk_duration=60)
+        else:
+            self.transcriber = ParakeetTranscriber(device="cpu", chunk_duration=60, quantization="int8")
+        self.transcriber.load_model()
+
+    def run(self, audio_path):
+        start = time.time()
+        transcript = self.transcriber.transcribe(audio_path)
+        return transcript, time.time() - start
+
+class DiarizeStage:
+    """Pyannote diarization, loaded once per process."""
+
+    def __init__(self):
+        import torch
+        from modules.pyannote_diarization import PyannoteDiarizer
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.diarizer = PyannoteDiarizer(device=device, max_speakers=25)
+
+    def run(self, audio_path):
+        return self.diarizer.diarize(audio_path)
+
+def finish_meeting(audio_path, transcript, transcribe_time, diarization_segments):
+    """Align one meeting and write its JSON and text transcripts."""
+    starts, ends, speakers = diarization_arrays(diarization_segments)
+    merged = merge_speaker_turns(align_proportionally(transcript, starts, ends, speakers))
+    stem = os.path.join("output", f"{Path(audio_path).stem}_transcript")
+
+    write_json(f"{stem}.json", {
+        "audio_path": audio_path,
+        "transcription_time": transcribe_time,
+        "num_speakers": len(np.unique(speakers)),
+        "num_segments": len(merged),
+        "segments": merged
+    })
+
+    lines = [
+        f"[{start_fmt}] {seg['speaker']}:\n{seg['text']}\n\n"
+        for seg, start_fmt in zip(merged, format_mmss([seg["start"] for seg in merged]))
+    ]
+    with open(f"{stem}.txt", "w") as f:
+        f.write("".join(lines))
+
+    print(f"✓ {audio_path}: {len(merged)} segments -> {stem}.json")
+
+def run_sequential(audio_paths):
+    transcribe, diarize = TranscribeStage(), DiarizeStage()
+    for audio_path in audio_paths:
+        transcript, transcribe_time = transcribe.run(audio_path)
+        finish_meeting(audio_path, transcript, transcribe_time, diarize.run(audio_path))
+
+def run_pipelined(audio_paths):
+    ray.init()
+    # Only claim a GPU share when the cluster has one, else the actor never schedules
+    num_gpus = TRANSCRIBE_NUM_GPUS if ray.cluster_resources().get("GPU", 0) > 0 else 0
+    transcriber = ray.remote(num_gpus=num_gpus)(TranscribeStage).remote()
+    diarizer = ray.remote(num_cpus=DIARIZE_NUM_CPUS)(DiarizeStage).remote()
+
+    # Each actor works through its queue in order; results are matched per file
+    pending = {}
+    for audio_path in audio_paths:
+        pending[transcriber.run.remote(audio_path)] = (audio_path, "transcript")
+        pending[diarizer.run.remote(audio_path)] = (audio_path, "segments")
+
+    results = {}
+    while pending:
+        (ready,), _ = ray.wait(list(pending), num_returns=1)
+        audio_path, kind = pending.pop(ready)
+        results.setdefault(audio_path, {})[kind] = ray.get(ready)
+        if len(results[audio_path]) == 2:
+            done = results.pop(audio_path)
+            transcript, transcribe_time = done["transcript"]
+            finish_meeting(audio_path, transcript, transcribe_time, done["segments"])
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 run_pipeline_batch.py <audio_file> [<audio_file> ...]")
+        sys.exit(1)
+
+    audio_paths = [os.path.abspath(p) for p in sys.argv[1:]]
+    os.makedirs("output", exist_ok=True)
+
+    start = time.time()
+    if ray is not None:
+        print(f"Processing {len(audio_paths)} files with Ray stage pipelining")
+        run_pipelined(audio_paths)
+    else:
+        print(f"Processing {len(audio_paths)} files sequentially (install ray to overlap stages)")
+        run_sequential(audio_paths)
+    print(f"\nDone in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -1,72 +1,85 @@
 #!/usr/bin/env python3
 """Test both Seafile and SFTP uploads with new filename convention."""
 
+import csv
+import json
 import os
+import shutil
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
-
-# Load environment
-load_dotenv()
 
 # Add modules to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Load environment
+from modules.env import load_env_once
+load_env_once()
+
 from modules.seafile_client import SeafileClient
 from modules.sftp_client import SFTPClient
 from modules.filename_generator import get_filename_generator
 
+# Sample transcript shared by all three test files
+TEST_SEGMENTS = [
+    {
+        "speaker": "Speaker A",
+        "text": "Senator Figueroa from Albuquerque spoke about the LFC budget at Santa Fe.",
+        "start": 0.0,
+        "end": 5.2
+    },
+    {
+        "speaker": "Speaker B",
+        "text": "Representatives Martinez, Gonzales, and Roybal testified on the HAFC proposal.",
+        "start": 5.2,
+        "end": 10.5
+    }
+]
+
 def create_test_files(base_name):
-    """Create test transcript files."""
+    """
+    Create test transcript files, writing each format straight to its temp file.
+    
+    Returns:
+        Tuple of ({ext: path}, {ext: size in bytes}); sizes come from each
+        handle's final offset, so no extra stat is needed
+    """
     test_files = {}
+    sizes = {}
+    now = datetime.now()
     
     # JSON content
-    json_content = f'''{{
-    "meeting": "Test Legislative Meeting",
-    "filename": "{base_name}",
-    "date": "{datetime.now().isoformat()}",
-    "transcript": [
-        {{
-            "speaker": "Speaker A",
-            "text": "Senator Figueroa from Albuquerque spoke about the LFC budget at Santa Fe.",
-            "start": 0.0,
-            "end": 5.2
-        }},
-        {{
-            "speaker": "Speaker B",
-            "text": "Representatives Martinez, Gonzales, and Roybal testified on the HAFC proposal.",
-            "start": 5.2,
-            "end": 10.5
-        }}
-    ]
-}}'''
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        json.dump({
+            "meeting": "Test Legislative Meeting",
+            "filename": base_name,
+            "date": now.isoformat(),
+            "transcript": TEST_SEGMENTS
+        }, f, indent=4)
+        test_files['json'] = f.name
+        sizes['json'] = f.tell()
     
     # CSV content
-    csv_content = f'''speaker,text,start,end
-Speaker A,"Senator Figueroa from Albuquerque spoke about the LFC budget at Santa Fe.",0.0,5.2
-Speaker B,"Representatives Martinez, Gonzales, and Roybal testified on the HAFC proposal.",5.2,10.5'''
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['speaker', 'text', 'start', 'end'])
+        writer.writerows((seg['speaker'], seg['text'], seg['start'], seg['end']) for seg in TEST_SEGMENTS)
+        test_files['csv'] = f.name
+        sizes['csv'] = f.tell()
     
     # TXT content
-    txt_content = f'''Legislative Meeting Transcript
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Filename: {base_name}
-
-Speaker A: Senator Figueroa from Albuquerque spoke about the LFC budget at Santa Fe.
-
-Speaker B: Representatives Martinez, Gonzales, and Roybal testified on the HAFC proposal.
-
---- End of Transcript ---'''
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+        f.write("Legislative Meeting Transcript\n")
+        f.write(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Filename: {base_name}\n\n")
+        f.writelines(f"{seg['speaker']}: {seg['text']}\n\n" for seg in TEST_SEGMENTS)
+        f.write("--- End of Transcript ---")
+        test_files['txt'] = f.name
+        sizes['txt'] = f.tell()
     
-    # Create temporary files
-    for ext, content in [('json', json_content), ('csv', csv_content), ('txt', txt_content)]:
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix=f'.{ext}', delete=False)
-        temp_file.write(content)
-        temp_file.close()
-        test_files[ext] = temp_file.name
-    
-    return test_files
+    return test_files, sizes
 
 def test_dual_upload():
     """Test uploading to both Seafile and SFTP."""
@@ -100,14 +113,13 @@ def test_dual_upload():
     
     # Create test files
     print(f"\n📝 Creating Test Files...")
-    test_files = create_test_files(base_name)
+    test_files, sizes = create_test_files(base_name)
     print(f"   ✅ Created 3 test files")
-    for ext, path in test_files.items():
-        size = os.path.getsize(path)
+    for ext, size in sizes.items():
         print(f"      - {ext.upper()}: {size} bytes")
     
     # Initialize Seafile
-    print(f"\n☁️  SEAFILE UPLOAD TEST")
+    print(f"\n☁️  SEAFILE CONNECTION")
     print("   " + "="*76)
     
     try:
@@ -125,26 +137,12 @@ def test_dual_upload():
     seafile_base_path = filename_gen.get_seafile_path(filename_info)
     print(f"   📁 Upload Path: {seafile_base_path}")
     
-    # Upload to Seafile
-    seafile_results = {}
-    for ext, local_file in test_files.items():
-        remote_path = f"{seafile_base_path}/{base_name}.{ext}"
-        print(f"\n   Uploading {ext.upper()}...")
-        
-        try:
-            success = seafile.upload_file(local_file, remote_path)
-            if success:
-                print(f"   ✅ SUCCESS: {remote_path}")
-                seafile_results[ext] = remote_path
-            else:
-                print(f"   ❌ FAILED: {remote_path}")
-        except Exception as e:
-            print(f"   ❌ ERROR: {e}")
-    
     # Initialize SFTP
-    print(f"\n\n📤 SFTP UPLOAD TEST")
+    print(f"\n📤 SFTP CONNECTION")
     print("   " + "="*76)
     
+    # Without SFTP the Seafile uploads still run and are reported
+    sftp = None
     try:
         sftp = SFTPClient(
             host=os.getenv('SFTP_HOST'),
@@ -157,48 +155,77 @@ def test_dual_upload():
         if sftp.connect():
             print(f"   ✅ Connected to SFTP: {os.getenv('SFTP_HOST')}:{os.getenv('SFTP_PORT')}")
         else:
-            print(f"   ❌ Failed to connect to SFTP")
-            return False
+            print(f"   ❌ Failed to connect to SFTP - skipping SFTP uploads")
+            sftp = None
             
     except Exception as e:
-        print(f"   ❌ Failed to initialize SFTP: {e}")
-        return False
-    
-    # Get SFTP path
-    sftp_path = filename_gen.get_sftp_path()
-    print(f"   📁 Upload Path: {sftp_path}")
+        print(f"   ❌ Failed to initialize SFTP: {e} - skipping SFTP uploads")
+        sftp = None
     
-    # Rename files for SFTP upload
     renamed_files = []
-    for ext, local_file in test_files.items():
-        proper_name = f"{base_name}.{ext}"
-        proper_path = os.path.join(os.path.dirname(local_file), proper_name)
+    if sftp is not None:
+        # Get SFTP path
+        sftp_path = filename_gen.get_sftp_path()
+        print(f"   📁 Upload Path: {sftp_path}")
         
-        # Rename
-        import shutil
-        shutil.copy2(local_file, proper_path)
-        renamed_files.append(proper_path)
+        # Rename files for SFTP upload
+        for ext, local_file in test_files.items():
+            proper_name = f"{base_name}.{ext}"
+            proper_path = os.path.join(os.path.dirname(local_file), proper_name)
+            
+            # Hard-link under the proper name (no data copied); copy if the
+            # filesystem doesn't support links
+            try:
+                os.link(local_file, proper_path)
+            except OSError:
+                shutil.copy2(local_file, proper_path)
+            renamed_files.append(proper_path)
     
-    # Upload to SFTP
-    print(f"\n   Uploading batch of {len(renamed_files)} files...")
+    # Create the remote folders once up front so concurrent uploads don't race on them
+    seafile.ensure_dir_exists(seafile_base_path)
+    if sftp is not None:
+        sftp.mkdir_p(sftp.upload_path)
+    
+    # Upload all six files at once: the two destinations are independent and
+    # every transfer is network-bound. The SFTP batch runs as one task that
+    # opens a channel per file on the already-authenticated SSH transport
+    print(f"\n🚀 Uploading {len(test_files) + len(renamed_files)} files concurrently...")
+    seafile_results = {}
     sftp_results = {}
     
-    try:
-        upload_results = sftp.upload_files(renamed_files, subfolder=None)
+    with ThreadPoolExecutor(max_workers=len(test_files) + 1) as executor:
+        futures = {}
+        for ext, local_file in test_files.items():
+            remote_path = f"{seafile_base_path}/{base_name}.{ext}"
+            futures[executor.submit(seafile.upload_file, local_file, remote_path)] = ('seafile', ext, remote_path)
+        if sftp is not None:
+            futures[executor.submit(sftp.upload_files_parallel, renamed_files, len(renamed_files))] = ('sftp', None, sftp.upload_path)
         
-        for filename, success in upload_results.items():
-            ext = filename.split('.')[-1].upper()
-            if success:
-                print(f"   ✅ SUCCESS: {filename}")
-                sftp_results[filename] = True
+        for future in as_completed(futures):
+            target, key, remote = futures[future]
+            label = '☁️  Seafile' if target == 'seafile' else '📤 SFTP'
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"   ❌ {label} ERROR: {remote}: {e}")
+                continue
+            
+            if target == 'sftp':
+                for filename, success in result.items():
+                    if success:
+                        print(f"   ✅ {label} SUCCESS: {filename}")
+                        sftp_results[filename] = True
+                    else:
+                        print(f"   ❌ {label} FAILED: {filename}")
+            elif result:
+                print(f"   ✅ {label} SUCCESS: {remote}")
+                seafile_results[key] = remote
             else:
-                print(f"   ❌ FAILED: {filename}")
-                
-    except Exception as e:
-        print(f"   ❌ ERROR during batch upload: {e}")
+                print(f"   ❌ {label} FAILED: {remote}")
     
     # Disconnect SFTP
-    sftp.disconnect()
+    if sftp is not None:
+        sftp.disconnect()
     
     # Cleanup
     print(f"\n🧹 Cleaning up test files...")
@@ -225,7 +252,10 @@ def test_dual_upload():
     for ext, path in seafile_results.items():
         print(f"   ✅ {ext.upper()}: {path}")
     
-    print(f"\n📤 SFTP Results: {len(sftp_results)}/3 files uploaded")
+    if sftp is None:
+        print(f"\n📤 SFTP Results: skipped (no connection)")
+    else:
+        print(f"\n📤 SFTP Results: {len(sftp_results)}/3 files uploaded")
     for filename in sftp_results.keys():
         print(f"   ✅ {filename}")
     
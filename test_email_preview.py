@@ -8,77 +8,55 @@ import os
 import datetime
 import tempfile
 import webbrowser
-from dotenv import load_dotenv
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Load environment variables
-load_dotenv()
+from modules.env import load_env_once
+load_env_once()
 
 def generate_test_email_preview():
     """Generate a test email preview with sample data."""
     
-    # Import the HTML template from notifications.py
-    from modules.notifications import send_notification
+    # Render the same template send_notification uses
+    from modules.notifications import render_email_html
     
-    # Read the HTML template from the file
-    with open('/Users/minimac/legislature-monitor/modules/notifications.py', 'r') as f:
-        content = f.read()
+    # Sample data for testing
+    sample_data = {
+        'COMMITTEE_NAME': 'Water and Natural Resources',
+        'MEETING_DATE': 'Monday, August 18, 2025',
+        'MEETING_TIME': '1:25 PM - 5:30 PM',
+        'STATUS': 'Transcription Complete & Available',
+        'VIDEO_SOURCE_URL': 'https://sg001-harmony.sliq.net/00293/Harmony/en/PowerBrowser/PowerBrowserV2/20250522/-1/77483',
+        'PROCESSING_TIME': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S MST'),
+        'NEXTCLOUD_LINK': 'https://cloud.dapengi.party/s/i7JwGFGaYwx2Tj3'
+    }
     
-    # Extract the HTML template
-    start_marker = "html_template = '''<!DOCTYPE html"
-    end_marker = "</html>'''"
+    html_content = render_email_html(sample_data)
     
-    start_idx = content.find(start_marker)
-    end_idx = content.find(end_marker, start_idx)
+    # Create temporary HTML file
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_file:
+        temp_file.write(html_content)
+        temp_file_path = temp_file.name
     
-    if start_idx != -1 and end_idx != -1:
-        # Extract the HTML template
-        template_start = content.find("'''", start_idx) + 3
-        html_template = content[template_start:end_idx + 7]
-        
-        # Sample data for testing
-        sample_data = {
-            'COMMITTEE_NAME': 'Water and Natural Resources',
-            'MEETING_DATE': 'Monday, August 18, 2025',
-            'MEETING_TIME': '1:25 PM - 5:30 PM',
-            'STATUS': 'Transcription Complete & Available',
-            'VIDEO_SOURCE_URL': 'https://sg001-harmony.sliq.net/00293/Harmony/en/PowerBrowser/PowerBrowserV2/20250522/-1/77483',
-            'PROCESSING_TIME': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S MST'),
-            'NEXTCLOUD_LINK': 'https://cloud.dapengi.party/s/i7JwGFGaYwx2Tj3'
-        }
-        
-        # Replace placeholders with sample data
-        html_content = html_template
-        for key, value in sample_data.items():
-            html_content = html_content.replace('{' + key + '}', value)
-        
-        # Create temporary HTML file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as temp_file:
-            temp_file.write(html_content)
-            temp_file_path = temp_file.name
-        
-        print("📧 Email Preview Generated!")
-        print("=" * 50)
-        print(f"Preview file: {temp_file_path}")
-        print()
-        print("🖼️  Logo Improvements:")
-        print("  ✅ Changed from WebP to PNG format")
-        print("  ✅ Reduced size to 180x47 pixels")
-        print("  ✅ Added better email client compatibility")
-        print("  ✅ Improved alt text for accessibility")
-        print("  ✅ Added padding and centering")
-        print()
-        print("🌐 Opening preview in browser...")
-        
-        # Open in default browser
-        webbrowser.open('file://' + temp_file_path)
-        
-        return temp_file_path
-    else:
-        print("❌ Could not extract HTML template from notifications.py")
-        return None
+    print("📧 Email Preview Generated!")
+    print("=" * 50)
+    print(f"Preview file: {temp_file_path}")
+    print()
+    print("🖼️  Logo Improvements:")
+    print("  ✅ Changed from WebP to PNG format")
+    print("  ✅ Reduced size to 180x47 pixels")
+    print("  ✅ Added better email client compatibility")
+    print("  ✅ Improved alt text for accessibility")
+    print("  ✅ Added padding and centering")
+    print()
+    print("🌐 Opening preview in browser...")
+    
+    # Open in default browser
+    webbrowser.open('file://' + temp_file_path)
+    
+    return temp_file_path
 
 def show_image_comparison():
     """Show comparison between old and new image URLs."""
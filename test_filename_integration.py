@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Test filename generation and upload paths."""
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -9,6 +11,66 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from modules.filename_generator import get_filename_generator
 
+# Case count from which a process pool pays for its worker start-up; smaller
+# runs (like the five cases below) are generated in-process in one batch
+PARALLEL_MIN_CASES = 200
+
+def format_case_report(i, test, info, seafile_path, sftp_path):
+    """Build the printed report for one test case."""
+    base_name = info['base_name']
+    return "\n".join([
+        f"\n{'='*80}",
+        f"TEST CASE {i}: {test['description']}",
+        f"{'='*80}",
+        f"\nMeeting Title: {test['title']}",
+        f"Meeting Date:  {test['date'].strftime('%Y-%m-%d %I:%M %p')}",
+        "\n📝 GENERATED FILENAME:",
+        f"   {base_name}",
+        "\n📊 COMPONENTS:",
+        f"   Date:         {info['date']}",
+        f"   Session Type: {info['session_type']}",
+        f"   Committee:    {info['committee']}",
+        f"   Start Time:   {info['start_time']}",
+        f"   End Time:     {info['end_time']}",
+        "\n☁️  SEAFILE UPLOAD PATHS:",
+        *(f"   {seafile_path}/{base_name}.{ext}" for ext in ('json', 'csv', 'txt')),
+        "\n📤 SFTP UPLOAD PATHS:",
+        *(f"   {sftp_path}/{base_name}.{ext}" for ext in ('json', 'csv', 'txt')),
+    ])
+
+def _preload_generator():
+    """Pool initializer: build the worker's generator before the first case."""
+    get_filename_generator()
+
+def _work_one_case(numbered_case):
+    """Generate and format one test case (runs in a pool worker)."""
+    i, test = numbered_case
+    gen = get_filename_generator()
+    info = gen.generate_filename(test['title'], test['date'])
+    return format_case_report(i, test, info, gen.get_seafile_path(info), gen.get_sftp_path())
+
+def build_case_reports(test_cases):
+    """Return the report for every test case, in order."""
+    if len(test_cases) >= PARALLEL_MIN_CASES:
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_preload_generator) as executor:
+            return list(executor.map(
+                _work_one_case, enumerate(test_cases, 1),
+                chunksize=max(1, len(test_cases) // (4 * workers))
+            ))
+    
+    # Generate every case's filename info up front; the SFTP path is the same for all
+    gen = get_filename_generator()
+    infos = gen.generate_filenames_batch(
+        [test['title'] for test in test_cases],
+        [test['date'] for test in test_cases]
+    )
+    sftp_path = gen.get_sftp_path()
+    return [
+        format_case_report(i, test, info, gen.get_seafile_path(info), sftp_path)
+        for i, (test, info) in enumerate(zip(test_cases, infos), 1)
+    ]
+
 def test_filename_integration():
     """Test complete filename and path generation."""
     
@@ -16,8 +78,6 @@ def test_filename_integration():
     print("LEGISLATIVE TRANSCRIPT FILENAME & PATH TEST")
     print("="*80)
     
-    gen = get_filename_generator()
-    
     # Test cases with real meeting examples
     test_cases = [
         {
@@ -47,52 +107,24 @@ def test_filename_integration():
         },
     ]
     
-    for i, test in enumerate(test_cases, 1):
-        print(f"\n{'='*80}")
-        print(f"TEST CASE {i}: {test['description']}")
-        print(f"{'='*80}")
-        print(f"\nMeeting Title: {test['title']}")
-        print(f"Meeting Date:  {test['date'].strftime('%Y-%m-%d %I:%M %p')}")
-        
-        # Generate filename info
-        info = gen.generate_filename(test['title'], test['date'])
-        
-        print(f"\n📝 GENERATED FILENAME:")
-        print(f"   {info['base_name']}")
-        
-        print(f"\n📊 COMPONENTS:")
-        print(f"   Date:         {info['date']}")
-        print(f"   Session Type: {info['session_type']}")
-        print(f"   Committee:    {info['committee']}")
-        print(f"   Start Time:   {info['start_time']}")
-        print(f"   End Time:     {info['end_time']}")
-        
-        # Get paths
-        seafile_path = gen.get_seafile_path(info)
-        sftp_path = gen.get_sftp_path()
-        
-        print(f"\n☁️  SEAFILE UPLOAD PATHS:")
-        print(f"   {seafile_path}/{info['base_name']}.json")
-        print(f"   {seafile_path}/{info['base_name']}.csv")
-        print(f"   {seafile_path}/{info['base_name']}.txt")
-        
-        print(f"\n📤 SFTP UPLOAD PATHS:")
-        print(f"   {sftp_path}/{info['base_name']}.json")
-        print(f"   {sftp_path}/{info['base_name']}.csv")
-        print(f"   {sftp_path}/{info['base_name']}.txt")
+    # One write per test case and one for the summary, rather than one per line
+    for report in build_case_reports(test_cases):
+        print(report)
     
     # Summary
-    print(f"\n\n{'='*80}")
-    print("SUMMARY")
-    print(f"{'='*80}")
-    print("\n✅ Filename Format: YYYYMMDD-{TYPE}-{COMMITTEE}-{START}-{END}")
-    print("\n✅ Seafile Structure:")
-    print("   Interim:  /Legislative Transcription/Interim/{COMMITTEE}/{YYYY-MM-DD}/captions/")
-    print("   Session:  /Legislative Transcription/Session/{HOUSE|SENATE}/{COMMITTEE}/{YYYY-MM-DD}/captions/")
-    print("\n✅ SFTP Structure:")
-    print("   All files: /private_html/inbound_uploads/ristra_data/incoming/")
-    print("\n✅ File Formats: .json, .csv, .txt")
-    print(f"{'='*80}")
+    print("\n".join([
+        f"\n\n{'='*80}",
+        "SUMMARY",
+        f"{'='*80}",
+        "\n✅ Filename Format: YYYYMMDD-{TYPE}-{COMMITTEE}-{START}-{END}",
+        "\n✅ Seafile Structure:",
+        "   Interim:  /Legislative Transcription/Interim/{COMMITTEE}/{YYYY-MM-DD}/captions/",
+        "   Session:  /Legislative Transcription/Session/{HOUSE|SENATE}/{COMMITTEE}/{YYYY-MM-DD}/captions/",
+        "\n✅ SFTP Structure:",
+        "   All files: /private_html/inbound_uploads/ristra_data/incoming/",
+        "\n✅ File Formats: .json, .csv, .txt",
+        f"{'='*80}",
+    ]))
     
     return True
 
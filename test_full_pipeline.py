@@ -8,6 +8,7 @@ import datetime
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Compatibility fix for torchaudio 2.9+ which removed list_audio_backends
@@ -19,8 +20,8 @@ if not hasattr(torchaudio, 'list_audio_backends'):
     torchaudio.list_audio_backends = _dummy_list_audio_backends
 
 # Load environment from .env
-from dotenv import load_dotenv
-load_dotenv()
+from modules.env import load_env_once
+load_env_once()
 
 from modules.video_processor import download_video, extract_audio_from_video
 from modules.transcript_pipeline import TranscriptPipeline
@@ -57,6 +58,12 @@ if not proxy_manager.test_proxy_connection(max_retries=3):
     sys.exit(1)
 print('   Proxy OK')
 
+# Load the transcription/diarization models while the video downloads and the
+# audio is extracted, so step 4 starts straight away
+pipeline = TranscriptPipeline(transcriber='parakeet')
+model_loader = ThreadPoolExecutor(max_workers=1)
+models_ready = model_loader.submit(pipeline.load_models)
+
 # Download video
 print('\n2. Downloading video...')
 download_start = time.time()
@@ -106,7 +113,8 @@ print(f'   Committee: {committee}')
 
 # Process with Parakeet pipeline
 print('\n4. Transcribing with Parakeet TDT + SpeechBrain Diarization...')
-pipeline = TranscriptPipeline(transcriber='parakeet')
+models_ready.result()
+model_loader.shutdown()
 
 transcribe_start = time.time()
 result = pipeline.process_meeting(
@@ -136,10 +144,9 @@ print(f'   Speakers: {len(speakers)}')
 # Show preview
 if segments:
     print('\n   Preview (first 3 segments):')
-    for seg in segments[:3]:
-        text = seg.get('text', '')[:80]
-        speaker = seg.get('speaker', '?')
-        print(f'     [{speaker}]: {text}...')
+    print('\n'.join(
+        f"     [{seg.get('speaker', '?')}]: {seg.get('text', '')[:80]}..." for seg in segments[:3]
+    ))
 
 # Generate filename
 base_name = f'{date_str}_{session_type}_{committee}_{start_time}-{end_time}'
@@ -148,37 +155,72 @@ print(f'\n   Filename: {base_name}')
 # Save files
 print('\n5. Saving transcript files...')
 formatted = result.get('formatted_transcripts', {})
-saved_files = {}
-for fmt in ['json', 'csv', 'txt']:
-    content = formatted.get(fmt)
-    if content:
-        output_path = os.path.join(OUTPUT_DIR, f'{base_name}.{fmt}')
-        with open(output_path, 'w') as f:
-            f.write(content)
-        saved_files[fmt] = output_path
-        print(f'   Saved {fmt.upper()}: {output_path}')
+FORMATS = ['json', 'csv', 'txt']
 
-# Upload to Seafile
-print('\n6. Uploading to Seafile...')
+
+def save_transcript(fmt):
+    output_path = os.path.join(OUTPUT_DIR, f'{base_name}.{fmt}')
+    with open(output_path, 'w') as f:
+        f.write(formatted[fmt])
+    return output_path
+
+
+# The three files are written concurrently, and each one's Seafile upload
+# (step 6) starts as soon as it is on disk
+file_io = ThreadPoolExecutor(max_workers=len(FORMATS))
+save_futures = {file_io.submit(save_transcript, fmt): fmt for fmt in FORMATS if formatted.get(fmt)}
+
+seafile_base = f'/Session/{session_type}/{committee}/{meeting_date.strftime("%Y-%m-%d")}/captions'
 try:
     seafile = SeafileClient(
         url=SEAFILE_URL,
         token=SEAFILE_API_TOKEN,
         library_id=SEAFILE_LIBRARY_ID
     )
-    seafile_results = {}
-    seafile_base = f'/Session/{session_type}/{committee}/{meeting_date.strftime("%Y-%m-%d")}/captions'
-
-    for fmt, local_path in saved_files.items():
-        remote_path = f'{seafile_base}/{base_name}.{fmt}'
-        if seafile.upload_file(local_path, remote_path):
-            print(f'   Uploaded {fmt.upper()} to Seafile')
-            seafile_results[fmt] = remote_path
-        else:
-            print(f'   Failed to upload {fmt.upper()} to Seafile')
+    # Create the folder once so the concurrent uploads don't race on it
+    seafile.ensure_dir_exists(seafile_base)
+    seafile_error = None
 except Exception as e:
-    print(f'   Seafile error: {e}')
-    seafile_results = {}
+    seafile = None
+    seafile_error = e
+
+saved_files = {}
+upload_futures = {}
+for future in as_completed(save_futures):
+    fmt = save_futures[future]
+    try:
+        output_path = future.result()
+    except OSError as e:
+        print(f'   Could not save {fmt.upper()}: {e}')
+        continue
+    saved_files[fmt] = output_path
+    print(f'   Saved {fmt.upper()}: {output_path}')
+    if seafile is not None:
+        upload_futures[fmt] = file_io.submit(seafile.upload_file, output_path, f'{seafile_base}/{base_name}.{fmt}')
+
+# Keep the usual json, csv, txt order for the later steps
+saved_files = {fmt: saved_files[fmt] for fmt in FORMATS if fmt in saved_files}
+
+# Upload to Seafile
+print('\n6. Uploading to Seafile...')
+seafile_results = {}
+if seafile_error is not None:
+    print(f'   Seafile error: {seafile_error}')
+for fmt in saved_files:
+    if fmt not in upload_futures:
+        continue
+    remote_path = f'{seafile_base}/{base_name}.{fmt}'
+    try:
+        uploaded = upload_futures[fmt].result()
+    except Exception as e:
+        print(f'   Seafile error: {e}')
+        uploaded = False
+    if uploaded:
+        print(f'   Uploaded {fmt.upper()} to Seafile')
+        seafile_results[fmt] = remote_path
+    else:
+        print(f'   Failed to upload {fmt.upper()} to Seafile')
+file_io.shutdown()
 
 # Upload to SFTP
 print('\n7. Uploading to SFTP...')
@@ -192,8 +234,10 @@ try:
     )
     sftp_results = {}
 
+    # Saved files are already named {base_name}.{fmt}; upload them side by side
+    upload_results = sftp.upload_files_parallel(list(saved_files.values()))
     for fmt, local_path in saved_files.items():
-        if sftp.upload_file(local_path, f'{base_name}.{fmt}'):
+        if upload_results.get(os.path.basename(local_path)):
             print(f'   Uploaded {fmt.upper()} to SFTP')
             sftp_results[fmt] = f'{SFTP_UPLOAD_PATH}/{base_name}.{fmt}'
         else:
@@ -275,10 +319,15 @@ print('=' * 70)
 
 # Show transcript sample
 txt_file = saved_files.get('txt')
-if txt_file and os.path.exists(txt_file):
-    print('\nTRANSCRIPT PREVIEW (first 1000 chars):')
-    print('-' * 70)
-    with open(txt_file) as f:
-        content = f.read()
-        print(content[:1000])
+if txt_file:
+    try:
+        # Only the preview is needed; don't load the whole transcript
+        with open(txt_file) as f:
+            preview = f.read(1000)
+    except FileNotFoundError:
+        preview = None
+    if preview is not None:
+        print('\nTRANSCRIPT PREVIEW (first 1000 chars):')
+        print('-' * 70)
+        print(preview)
         print('...')
@@ -205,7 +205,7 @@ if txt_file and os.path.exists(txt_file):
     print('\n' + '-' * 70)
     print('TRANSCRIPT PREVIEW (first 500 chars):')
     print('-' * 70)
+    # Only the preview is needed; don't load the whole transcript
     with open(txt_file) as f:
-        content = f.read()
-        print(content[:500])
+        print(f.read(500))
         print('...')
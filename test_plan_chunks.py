@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Test chunk planning in run_aligned_pipeline_v2 (no audio or models needed)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from run_aligned_pipeline_v2 import plan_chunks, MAX_CHUNK_SECONDS, CHUNK_OVERLAP_SECONDS
+
+# One second past a multiple of the chunk limit used to leave a 1 s last chunk;
+# 80 s used to give 41 s chunks (the overlap was added on top of the limit)
+DURATIONS = [MAX_CHUNK_SECONDS * n + 1 for n in (1, 2, 10, 90)] + [80, 3600, 25.5, 40, 7 * 3600 + 13.37]
+
+
+def check_plan(duration):
+    """Return a list of problems with the chunk plan for duration (empty if fine)."""
+    bounds = plan_chunks(duration)
+    problems = []
+    if bounds[0][0] != 0:
+        problems.append(f"first chunk starts at {bounds[0][0]}")
+    if abs(bounds[-1][1] - duration) > 1e-6:
+        problems.append(f"last chunk ends at {bounds[-1][1]}, not {duration}")
+
+    # Actual chunk lengths, overlap included
+    lengths = [end - start for start, end in bounds]
+    if max(lengths) > MAX_CHUNK_SECONDS + 1e-6:
+        problems.append(f"chunk of {max(lengths):.3f}s exceeds {MAX_CHUNK_SECONDS}s")
+    if max(lengths) - min(lengths) > 1e-6:
+        problems.append(f"uneven chunks: {min(lengths):.3f}s to {max(lengths):.3f}s")
+
+    for (start, end), (next_start, _) in zip(bounds, bounds[1:]):
+        if abs(end - next_start - CHUNK_OVERLAP_SECONDS) > 1e-6:
+            problems.append(f"chunk ({start:.3f}, {end:.3f}) does not overlap the next by {CHUNK_OVERLAP_SECONDS}s")
+            break
+    return problems
+
+
+def main():
+    print("=" * 60)
+    print("Chunk Planning Test")
+    print("=" * 60)
+
+    failures = 0
+    for duration in DURATIONS:
+        bounds = plan_chunks(duration)
+        problems = check_plan(duration)
+        status = "OK  " if not problems else "FAIL"
+        print(f"{status} {duration:>9.2f}s -> {len(bounds)} chunks, last {bounds[-1][1] - bounds[-1][0]:.2f}s")
+        for problem in problems:
+            print(f"     {problem}")
+        failures += bool(problems)
+
+    print()
+    if failures:
+        print(f"❌ {failures} of {len(DURATIONS)} plans failed")
+        return False
+    print(f"✅ All {len(DURATIONS)} plans OK")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)